@@ -0,0 +1,78 @@
+# backends.py
+"""
+Numeric backends for the calculator
+
+calculator.add/subtract/multiply/divide only use + - * / and == 0, so
+they work on any Python number type. A backend picks that type:
+
+- float:    fast, but binary (0.1 + 0.2 = 0.30000000000000004) and only
+            ~15-17 significant digits
+- decimal:  exact decimal digits (money), results rounded to a
+            configurable precision and rounding mode
+- fraction: exact rational numbers, never rounds (gets slow when
+            numerators/denominators grow)
+- int:      exact whole numbers of any size; division stays exact
+            (a whole number when it divides evenly, else a Fraction)
+
+Usage:
+    from backends import get_backend
+    backend = get_backend("decimal", precision=34, rounding="half_up")
+    backend.activate()                   # Decimal uses the thread's context
+    backend.calculate("+", "0.1", "0.2") # -> Decimal('0.3')
+"""
+
+import decimal
+from fractions import Fraction
+
+from calculator import add, divide, multiply, subtract
+
+BACKENDS = ("float", "decimal", "fraction", "int")
+DECIMAL_PRECISION = 28  # significant digits, Python's default
+ROUNDING_MODES = {
+    name.removeprefix("ROUND_").lower(): getattr(decimal, name)
+    for name in dir(decimal) if name.startswith("ROUND_")
+}
+
+
+def int_divide(a, b):
+    """Exact division of whole numbers: an int if it divides evenly, else a Fraction."""
+    result = divide(Fraction(a), b)
+    if isinstance(result, Fraction) and result.denominator == 1:
+        return result.numerator
+    return result
+
+
+class Backend:
+    """How text becomes a number, and which function each operator uses."""
+
+    def __init__(self, name, parse, divide=divide, context=None):
+        self.name = name
+        self.parse = parse
+        self.context = context
+        self.operations = {"+": add, "-": subtract, "*": multiply, "/": divide}
+
+    def activate(self):
+        """Install the Decimal context for this thread (no-op for other backends)."""
+        if self.context is not None:
+            decimal.setcontext(self.context)
+
+    def calculate(self, op, a, b):
+        return self.operations[op](self.parse(a), self.parse(b))
+
+
+def get_backend(name="float", precision=DECIMAL_PRECISION, rounding="half_even"):
+    """Build a backend by name; precision and rounding only apply to "decimal"."""
+    if name == "float":
+        return Backend("float", float)
+    if name == "decimal":
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding mode: {rounding} "
+                             f"(choose from {', '.join(sorted(ROUNDING_MODES))})")
+        context = decimal.Context(prec=precision, rounding=ROUNDING_MODES[rounding])
+        # Decimal(text) is exact; rounding happens in the arithmetic
+        return Backend("decimal", decimal.Decimal, context=context)
+    if name == "fraction":
+        return Backend("fraction", Fraction)
+    if name == "int":
+        return Backend("int", int, divide=int_divide)
+    raise ValueError(f"Unknown backend: {name} (choose from {', '.join(BACKENDS)})")
@@ -0,0 +1,151 @@
+# batch_calculator.py
+"""
+Batch (non-interactive) mode for the calculator
+
+calculator.py works on one pair of numbers typed in with input(). This
+module applies the same four operations to whole columns at once with
+NumPy, so they can be used on bulk data:
+
+- add / subtract / multiply / divide work element-wise on arrays
+  (one C loop instead of one Python call per pair)
+- division by zero gives NaN instead of the "Error: Cannot divide by
+  zero!" string, or a masked value with masked=True
+- columns come from a CSV file (by header name) or .npy / .npz files;
+  empty or unreadable CSV fields are read as NaN (missing input)
+
+Usage (Python):
+    from batch_calculator import calculate_columns
+    calculate_columns("divide", [1, 2, 3], [2, 0, 4])   # -> [0.5, nan, 0.75]
+
+Usage (CLI):
+    python batch_calculator.py data.csv divide --a price --b quantity -o result.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+PREVIEW_ROWS = 10
+
+
+# --------------- OPERATIONS ---------------
+
+def add(a, b):
+    return np.add(a, b)
+
+
+def subtract(a, b):
+    return np.subtract(a, b)
+
+
+def multiply(a, b):
+    return np.multiply(a, b)
+
+
+def divide(a, b):
+    """a / b, with NaN wherever b is 0 (no warnings, no inf)."""
+    out = np.full(np.broadcast_shapes(np.shape(a), np.shape(b)), np.nan)
+    return np.divide(a, b, out=out, where=np.not_equal(b, 0))
+
+
+OPERATIONS = {"add": add, "subtract": subtract, "multiply": multiply, "divide": divide}
+SYMBOLS = {"+": "add", "-": "subtract", "*": "multiply", "/": "divide"}
+
+
+def calculate_columns(operation, a, b, masked=False):
+    """
+    Apply an operation ("add" or "+", ...) to two columns of numbers.
+
+    Returns a float64 array; with masked=True a masked array where the
+    NaN results (division by zero, missing input) are masked instead.
+    """
+    name = SYMBOLS.get(operation, operation)
+    if name not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    result = OPERATIONS[name](a, b)
+    return np.ma.masked_invalid(result) if masked else result
+
+
+# --------------- INPUT / OUTPUT ---------------
+
+def load_columns(path, a=None, b=None):
+    """
+    Two float columns from a file:
+    - .csv: by header name (default: the first two columns)
+    - .npy: a 2-D array, by column index (default: 0 and 1)
+    - .npz: by array name (default: the first two arrays)
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npz":
+        with np.load(path) as data:
+            names = data.files
+            return data[a or names[0]], data[b or names[1]]
+    if ext == ".npy":
+        array = np.load(path)
+        return array[:, int(a or 0)], array[:, int(b or 1)]
+
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f))
+    try:
+        columns = (header.index(a) if a else 0, header.index(b) if b else 1)
+    except ValueError:
+        raise ValueError(f"Column not found. Available columns: {', '.join(header)}") from None
+    options = dict(delimiter=",", usecols=columns, unpack=True, dtype=np.float64, ndmin=2)
+    try:
+        # loadtxt parses in C; unpack gives one array per column
+        return np.loadtxt(path, skiprows=1, **options)
+    except ValueError:
+        # An empty or non-numeric field: the slower genfromtxt reads it as NaN
+        return np.genfromtxt(path, skip_header=1, invalid_raise=False, **options)
+
+
+def save_result(path, result):
+    """Write the result column to .npy or .csv (NaN is written as 'nan')."""
+    result = np.ma.filled(result, np.nan)
+    if path.lower().endswith(".npy"):
+        np.save(path, result)
+    else:
+        np.savetxt(path, result, fmt="%.17g", header="result", comments="")
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Apply a calculator operation to two columns.")
+    parser.add_argument("input", help="CSV, .npy or .npz file")
+    parser.add_argument("operation", choices=sorted(OPERATIONS) + sorted(SYMBOLS))
+    parser.add_argument("--a", help="First column (CSV header / array name / index)")
+    parser.add_argument("--b", help="Second column")
+    parser.add_argument("-o", "--output", help="Write results to this .csv or .npy file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        a, b = load_columns(args.input, args.a, args.b)
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        print(f"[ERROR] Could not read {args.input}: {e}")
+        sys.exit(1)
+
+    result = calculate_columns(args.operation, a, b)
+    invalid = int(np.isnan(result).sum())
+    print(f"[INFO] {len(result):,} rows, {invalid:,} without a result (division by zero or missing)")
+
+    if args.output:
+        save_result(args.output, result)
+        print(f"[DONE] Results written to {args.output}")
+    else:
+        for value in result[:PREVIEW_ROWS]:
+            print(value)
+        if len(result) > PREVIEW_ROWS:
+            print(f"... ({len(result) - PREVIEW_ROWS:,} more, use -o to save them all)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# benchmark.py
+"""
+Benchmarks for the calculator.
+
+vector: scalar calculator functions vs. the NumPy batch mode. For each
+size, random pairs (about 1% of the divisors are 0) go through:
+
+- scalar: calculator.add/subtract/multiply/divide, one Python call per pair
+- vector: batch_calculator.calculate_columns, one call per column
+
+and the results are checked to agree (NaN where the scalar path returns
+the "Error: ..." string).
+
+backends: speed and accuracy of each numeric backend (backends.py) on
+money amounts (2 decimals) and 30-digit whole numbers. Accuracy is the
+relative error against the exact answer (computed with Fractions), and
+the summary names the fastest backend for each error budget.
+
+Usage:
+    python benchmark.py vector --pairs 1000000 5000000
+    python benchmark.py backends --pairs 100000 --precision 28
+"""
+
+import argparse
+import math
+import random
+import time
+from fractions import Fraction
+
+import numpy as np
+
+import calculator
+from backends import BACKENDS, DECIMAL_PRECISION, get_backend
+from batch_calculator import OPERATIONS, calculate_columns
+
+ZERO_RATE = 0.01
+ACCURACY_SAMPLE = 20_000       # pairs checked against the exact answer
+ERROR_BUDGETS = (1e-9, 1e-15, 1e-27, 0)
+EXACT_OPS = {"+": calculator.add, "-": calculator.subtract,
+             "*": calculator.multiply, "/": calculator.divide}
+
+
+def make_pairs(rng, count):
+    a = rng.uniform(-1000, 1000, count)
+    b = rng.uniform(-1000, 1000, count)
+    b[rng.random(count) < ZERO_RATE] = 0.0
+    return a, b
+
+
+def best_time(func, repeat):
+    best, result = math.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def same_results(scalar, vector):
+    expected = np.array([math.nan if isinstance(x, str) else x for x in scalar])
+    return np.allclose(expected, vector, rtol=0, atol=0, equal_nan=True)
+
+
+# --------------- SCALAR VS. VECTOR ---------------
+
+def bench_vector(sizes, repeat, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'pairs':>10} {'operation':>10} {'scalar s':>10} {'vector s':>10} "
+          f"{'speed-up':>9} {'M pairs/s':>10}  check")
+    print("-" * 72)
+    for size in sizes:
+        a, b = make_pairs(rng, size)
+        # The scalar path gets plain Python floats, like input() would give it
+        a_list, b_list = a.tolist(), b.tolist()
+        for name in OPERATIONS:
+            scalar_func = getattr(calculator, name)
+            scalar_s, scalar = best_time(lambda: list(map(scalar_func, a_list, b_list)), repeat)
+            vector_s, vector = best_time(lambda: calculate_columns(name, a, b), repeat)
+            print(f"{size:>10,} {name:>10} {scalar_s:>10.3f} {vector_s:>10.4f} "
+                  f"{scalar_s / vector_s:>8.0f}x {size / vector_s / 1e6:>10.0f}  "
+                  f"{'ok' if same_results(scalar, vector) else 'MISMATCH'}")
+
+
+# --------------- NUMERIC BACKENDS ---------------
+
+def make_datasets(rng, count):
+    """Operand pairs as text (like the CLI reads them); no zero divisors."""
+    money = [(f"{rng.uniform(0.01, 10_000):.2f}", f"{rng.uniform(0.01, 10_000):.2f}")
+             for _ in range(count)]
+    bigint = [(str(rng.randrange(10**29, 10**30)), str(rng.randrange(10**29, 10**30)))
+              for _ in range(count)]
+    return {"money": money, "bigint": bigint}
+
+
+def time_backend(backend, pairs, repeat):
+    """Best seconds to parse and calculate every pair with every operation."""
+    parse, operations = backend.parse, backend.operations
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for func in operations.values():
+            for a, b in pairs:
+                func(parse(a), parse(b))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def max_relative_error(backend, pairs):
+    """Largest relative error over all operations (0 = every result exact)."""
+    worst = Fraction(0)
+    for op, func in backend.operations.items():
+        exact_func = EXACT_OPS[op]
+        for a, b in pairs:
+            exact = exact_func(Fraction(a), Fraction(b))
+            error = abs(Fraction(func(backend.parse(a), backend.parse(b))) - exact)
+            worst = max(worst, error / abs(exact) if exact else error)
+    return float(worst)
+
+
+def bench_backends(count, repeat, seed, precision):
+    datasets = make_datasets(random.Random(seed), count)
+    results = {}  # (dataset, backend) -> (ops per second, max error) or None
+    print(f"{'data':>8} {'backend':>9} {'ops/s':>12} {'max rel. error':>15}")
+    print("-" * 48)
+    for data_name, pairs in datasets.items():
+        for name in BACKENDS:
+            backend = get_backend(name, precision=precision)
+            backend.activate()
+            try:
+                seconds = time_backend(backend, pairs, repeat)
+            except ValueError:
+                # e.g. the int backend can't read "12.34"
+                results[data_name, name] = None
+                print(f"{data_name:>8} {name:>9} {'-':>12} {'cannot parse':>15}")
+                continue
+            error = max_relative_error(backend, pairs[:ACCURACY_SAMPLE])
+            ops = count * len(backend.operations) / seconds
+            results[data_name, name] = (ops, error)
+            print(f"{data_name:>8} {name:>9} {ops:>12,.0f} {error:>15.3g}")
+    get_backend("float").activate()
+
+    print(f"\nFastest backend within an error budget (decimal precision {precision}):")
+    print(f"{'data':>8} " + " ".join(f"{f'<= {budget:g}':>12}" for budget in ERROR_BUDGETS))
+    for data_name in datasets:
+        picks = []
+        for budget in ERROR_BUDGETS:
+            ok = [(r[0], name) for name in BACKENDS
+                  if (r := results[data_name, name]) is not None and r[1] <= budget]
+            picks.append(max(ok)[1] if ok else "-")
+        print(f"{data_name:>8} " + " ".join(f"{pick:>12}" for pick in picks))
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Calculator benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    vector = sub.add_parser("vector", help="Scalar functions vs. NumPy batch mode")
+    vector.add_argument("--pairs", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    vector.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    vector.add_argument("--seed", type=int, default=42)
+
+    backends = sub.add_parser("backends", help="Speed & accuracy of the numeric backends")
+    backends.add_argument("--pairs", type=int, default=100_000)
+    backends.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    backends.add_argument("--seed", type=int, default=42)
+    backends.add_argument("--precision", type=int, default=DECIMAL_PRECISION,
+                          help="Significant digits for the decimal backend")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "vector":
+        bench_vector(args.pairs, args.repeat, args.seed)
+    else:
+        bench_backends(args.pairs, args.repeat, args.seed, args.precision)
@@ -55,5 +55,6 @@ def calculator():
 
         print("Result:", result)
 
-# Run the calculator
-calculator()
+# Run the calculator (only when started directly, not on import)
+if __name__ == "__main__":
+    calculator()
@@ -0,0 +1,223 @@
+# pipeline.py
+"""
+Streaming calculator for shell pipelines
+
+Reads one calculation per line from stdin (or a file) and writes one
+result per line to stdout, in the same order, so it can sit between other
+tools and handle inputs of any size:
+
+    3 + 4          expression: <number> <op> <number>, op is + - * /
+    3,4            operand row (with --op): two numbers separated by
+                   a comma, tab or spaces
+
+- the operators map to calculator.add/subtract/multiply/divide through
+  a dispatch table; the line pattern is compiled once
+- lines are processed one at a time (constant memory) and results are
+  written in batches through large buffers, then flushed, so output
+  appears while the input is still being read
+- blank lines give blank output lines, unreadable lines give
+  "Error: Invalid input!" (so output lines always match input lines)
+- --stats reports lines/s and MB/s on stderr while running
+- --backend picks the number type (float, decimal, fraction, int; see
+  backends.py)
+
+Usage:
+    python pipeline.py < expressions.txt > results.txt
+    python pipeline.py prices.csv --op / --skip-header --stats
+    python pipeline.py invoices.txt --backend decimal --precision 34
+    printf "1 + 2\\n10 / 0\\n" | python pipeline.py
+"""
+
+import argparse
+import re
+import sys
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+from backends import BACKENDS, DECIMAL_PRECISION, ROUNDING_MODES, get_backend
+from calculator import add, divide, multiply, subtract
+
+# --------------- CONFIG ---------------
+
+DISPATCH = {"+": add, "-": subtract, "*": multiply, "/": divide}
+
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+EXPRESSION = re.compile(rf"\s*({NUMBER})\s*([-+*/])\s*({NUMBER})\s*")
+ROW_SEPARATOR = re.compile(r"\s*[,\t ]\s*")
+
+INVALID = "Error: Invalid input!"
+BUFFER_SIZE = 1 << 20   # bytes of read/write buffer
+BATCH_LINES = 4096      # results written (and flushed) together
+REPORT_SECONDS = 2.0    # how often --stats prints progress
+
+
+# --------------- EVALUATORS ---------------
+
+def make_expression_evaluator(number=float, dispatch=DISPATCH):
+    """Evaluator for '<a> <op> <b>' lines."""
+    match = EXPRESSION.fullmatch
+
+    def evaluate(line):
+        m = match(line)
+        if m is None:
+            return INVALID
+        a, op, b = m.groups()
+        try:
+            return dispatch[op](number(a), number(b))
+        except (ValueError, ArithmeticError):
+            # e.g. "1.5" with the int backend, or a Decimal overflow
+            return INVALID
+
+    return evaluate
+
+
+def make_row_evaluator(op, number=float, dispatch=DISPATCH):
+    """Evaluator for 'a,b' lines, all with the same operation."""
+    func = dispatch[op]
+    split = ROW_SEPARATOR.split
+
+    def evaluate(line):
+        parts = split(line.strip())
+        if len(parts) != 2:
+            return INVALID
+        try:
+            return func(number(parts[0]), number(parts[1]))
+        except (ValueError, ArithmeticError):
+            return INVALID
+
+    return evaluate
+
+
+# --------------- STREAMING ---------------
+
+def format_result(value, spec):
+    """format(value, spec), also for the Fractions of the fraction/int backends."""
+    if isinstance(value, Fraction):
+        # Fraction has no float-style specs (.2f, e, ...) before Python 3.12;
+        # Decimal does, rounded to the current Decimal precision
+        value = Decimal(value.numerator) / value.denominator
+    return format(value, spec)
+
+
+class Throughput:
+    """Counts lines and bytes; prints progress to stderr every `interval` seconds."""
+
+    def __init__(self, enabled, interval=REPORT_SECONDS):
+        self.enabled = enabled
+        self.interval = interval
+        self.lines = 0
+        self.bytes = 0
+        self.errors = 0
+        self.start = self.last_report = time.perf_counter()
+
+    def update(self, lines, size, errors):
+        self.lines += lines
+        self.bytes += size
+        self.errors += errors
+        if self.enabled and time.perf_counter() - self.last_report >= self.interval:
+            self.last_report = time.perf_counter()
+            self.report("[PROGRESS]")
+
+    def report(self, label):
+        seconds = max(time.perf_counter() - self.start, 1e-9)
+        print(f"{label} {self.lines:,} lines ({self.errors:,} errors) in {seconds:.1f} s - "
+              f"{self.lines / seconds:,.0f} lines/s, {self.bytes / seconds / 1e6:.1f} MB/s",
+              file=sys.stderr)
+
+
+def run(lines, evaluate, out, stats, result_format=None, batch_lines=BATCH_LINES):
+    """Evaluate every line and write the results to `out`, batch by batch."""
+    to_text = str if result_format is None else (lambda value: format_result(value, result_format))
+    batch, size, errors = [], 0, 0
+    for line in lines:
+        size += len(line)
+        if line.strip():
+            result = evaluate(line)
+            if isinstance(result, str):
+                errors += 1
+                batch.append(result)
+            else:
+                batch.append(to_text(result))
+        else:
+            batch.append("")
+        if len(batch) >= batch_lines:
+            out.write("\n".join(batch) + "\n")
+            out.flush()
+            stats.update(len(batch), size, errors)
+            batch, size, errors = [], 0, 0
+    if batch:
+        out.write("\n".join(batch) + "\n")
+        stats.update(len(batch), size, errors)
+    out.flush()
+
+
+# --------------- CLI ---------------
+
+def check_format(parser, backend, spec):
+    """Reject a --format spec the backend's results can't use, before reading any input."""
+    # A whole number and a division result cover every result type of a backend
+    samples = (backend.parse("1"), backend.calculate("/", "1", "3"))
+    try:
+        for value in samples:
+            format_result(value, spec)
+    except (ValueError, TypeError) as e:
+        parser.error(f"--format {spec!r} can't be used with the {backend.name} backend: {e}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Evaluate one calculation per line, streaming.")
+    parser.add_argument("input", nargs="?", help="Input file (default: stdin)")
+    parser.add_argument("--op", choices=sorted(DISPATCH),
+                        help="Lines are 'a,b' operand rows for this operation")
+    parser.add_argument("--skip-header", action="store_true", help="Ignore the first line")
+    parser.add_argument("--format", dest="result_format",
+                        help="Format spec for results, e.g. .2f (default: as Python prints them)")
+    parser.add_argument("--backend", choices=BACKENDS, default="float",
+                        help="Number type used for the calculations")
+    parser.add_argument("--precision", type=int, default=DECIMAL_PRECISION,
+                        help="Significant digits (decimal backend)")
+    parser.add_argument("--rounding", choices=sorted(ROUNDING_MODES), default="half_even",
+                        help="Rounding mode (decimal backend)")
+    parser.add_argument("--batch", type=int, default=BATCH_LINES, help="Results per write")
+    parser.add_argument("--stats", action="store_true", help="Report throughput on stderr")
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    backend = get_backend(args.backend, args.precision, args.rounding)
+    backend.activate()
+    if args.result_format is not None:
+        check_format(parser, backend, args.result_format)
+    if args.op:
+        evaluate = make_row_evaluator(args.op, backend.parse, backend.operations)
+    else:
+        evaluate = make_expression_evaluator(backend.parse, backend.operations)
+
+    source = args.input if args.input else sys.stdin.fileno()
+    # Interactive use: answer every line right away
+    batch = 1 if args.input is None and sys.stdin.isatty() else args.batch
+    stats = Throughput(args.stats)
+    try:
+        with open(source, encoding="utf-8", errors="replace", buffering=BUFFER_SIZE,
+                  closefd=args.input is not None) as lines, \
+             open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=BUFFER_SIZE,
+                  closefd=False) as out:
+            if args.skip_header:
+                next(lines, None)
+            run(lines, evaluate, out, stats, args.result_format, batch)
+    except BrokenPipeError:
+        # The next command stopped reading (e.g. `| head`); that's fine
+        sys.stderr.close()
+        return
+    except OSError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.stats:
+        stats.report("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
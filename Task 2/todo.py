@@ -8,14 +8,20 @@ Features added per request:
 - Exports saved into "exports/" folder
 - Auto-delete old exports older than AUTO_DELETE_DAYS
 - CSV export (timestamped) saved to exports/ as well
+- Optional: one PDF per category, rendered in parallel worker processes
 """
 
 import csv
 import os
+import sys
 import json
 import glob
 from datetime import datetime, date, timedelta
 
+# Shared process-pool job runner (../shared/jobrunner.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from jobrunner import Job, JobRunner
+
 # ---------- CONFIG ----------
 CSV_FILE = "tasks.csv"
 EXPORTS_DIR = "exports"
@@ -24,6 +30,7 @@ USER_FULL_NAME = "Kethari Madhu Sudhan Reddy"  # your name to print in PDF heade
 APP_TITLE = "Madhu's To-Do CLI"
 DATE_FORMAT = "%Y-%m-%d"
 TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+PDF_JOB_TIMEOUT = 60  # seconds per PDF when rendering many at once
 
 # ---------- Utilities ----------
 def timestamp_now():
@@ -455,31 +462,25 @@ def export_to_csv(tasks, filename=None):
             })
     print(f"Exported tasks to {filename}")
 
-def export_to_pdf(tasks):
-    ensure_exports_dir()
-    clean_old_exports()
+def fpdf_available():
     try:
         from fpdf import FPDF
+        return True
     except Exception:
         print("PDF export requires 'fpdf' package.")
         print("Install with: pip install fpdf")
-        choice = input("Export to CSV instead? (yes/no): ").strip().lower()
-        if choice == "yes":
-            export_to_csv(tasks)
-        else:
-            print("PDF export cancelled.")
-        return
+        return False
 
-    ts = timestamp_now()
-    human_ts = timestamp_human()
-    filename = os.path.join(EXPORTS_DIR, f"tasks_export_{ts}.pdf")
+def render_tasks_pdf(filename, tasks, human_ts, subtitle=None):
+    """Write one PDF of `tasks` (module level, so worker processes can run it)."""
+    from fpdf import FPDF
 
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=12)
     pdf.add_page()
     pdf.set_font("Arial", "B", 14)
     # Header: App title and user name
-    pdf.cell(0, 8, APP_TITLE, ln=True)
+    pdf.cell(0, 8, APP_TITLE if not subtitle else f"{APP_TITLE} - {subtitle}", ln=True)
     pdf.set_font("Arial", size=11)
     pdf.cell(0, 7, f"Owner: {USER_FULL_NAME}", ln=True)
     pdf.cell(0, 7, f"Exported: {human_ts}", ln=True)
@@ -508,8 +509,56 @@ def export_to_pdf(tasks):
     pdf.cell(0, 6, f"Generated by {APP_TITLE} for {USER_FULL_NAME} on {human_ts}", ln=True, align="C")
 
     pdf.output(filename)
+    return filename
+
+def export_to_pdf(tasks):
+    ensure_exports_dir()
+    clean_old_exports()
+    if not fpdf_available():
+        choice = input("Export to CSV instead? (yes/no): ").strip().lower()
+        if choice == "yes":
+            export_to_csv(tasks)
+        else:
+            print("PDF export cancelled.")
+        return
+
+    ts = timestamp_now()
+    filename = os.path.join(EXPORTS_DIR, f"tasks_export_{ts}.pdf")
+    render_tasks_pdf(filename, tasks, timestamp_human())
     print(f"Exported tasks to {filename}")
 
+def export_pdfs_by_category(tasks, workers=None):
+    """One PDF per category, rendered in parallel (see shared/jobrunner.py)."""
+    ensure_exports_dir()
+    clean_old_exports()
+    if not fpdf_available():
+        print("PDF export cancelled.")
+        return
+
+    by_category = {}
+    for t in tasks:
+        by_category.setdefault(t.get("category") or "General", []).append(t)
+    if not by_category:
+        print("No tasks to export.")
+        return
+
+    ts = timestamp_now()
+    human_ts = timestamp_human()
+    jobs = []
+    for category, cat_tasks in sorted(by_category.items()):
+        safe = "".join(c if c.isalnum() else "_" for c in category)
+        filename = os.path.join(EXPORTS_DIR, f"tasks_export_{ts}_{safe}.pdf")
+        jobs.append(Job(category, render_tasks_pdf, (filename, cat_tasks, human_ts, category)))
+
+    runner = JobRunner(workers=workers, timeout=PDF_JOB_TIMEOUT, preload=["fpdf"])
+    report = runner.run(jobs)
+    for result in report.results:
+        if result.ok:
+            print(f"Exported '{result.name}' tasks to {result.value}")
+        else:
+            print(f"Could not export '{result.name}': {result.error}")
+    print(report.summary())
+
 # ----------------- Main loop -----------------
 def main():
     tasks = load_tasks()
@@ -528,7 +577,7 @@ def main():
         print("8. Add a subtask to a task")
         print("9. Search tasks")
         print("10. Sort / Sorting views")
-        print("11. Export to PDF (saved to exports/ with timestamped filename)")
+        print("11. Export to PDF (saved to exports/ with timestamped filename, optionally one per category)")
         print("12. Export to CSV (saved to exports/ with timestamped filename)")
         print("13. Exit")
 
@@ -554,7 +603,11 @@ def main():
         elif choice == "10":
             sort_menu(tasks)
         elif choice == "11":
-            export_to_pdf(tasks)
+            per_category = input("One PDF per category? (yes/no): ").strip().lower() == "yes"
+            if per_category:
+                export_pdfs_by_category(tasks)
+            else:
+                export_to_pdf(tasks)
         elif choice == "12":
             export_to_csv(tasks)
         elif choice == "13":
@@ -9,12 +9,18 @@ Features:
 - Save headlines to .txt
 - Export headlines to PDF using FPDF
 - Filenames include date and time
+- "All websites" renders the PDFs in parallel worker processes
+- requests / BeautifulSoup are imported on first use, so the menu
+  appears right away
 """
 
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import os
+import sys
+
+# Shared process-pool job runner (../shared/jobrunner.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from jobrunner import Job, JobRunner
 
 # --------------- CONFIG ---------------
 
@@ -26,6 +32,7 @@ SITES = {
 
 DEFAULT_TOP_N = 10
 OUTPUT_DIR = "outputs"  # all files saved here
+PDF_JOB_TIMEOUT = 60    # seconds per PDF when rendering several at once
 
 
 # --------------- HELPERS ---------------
@@ -47,6 +54,8 @@ def ensure_output_dir():
 
 def fetch_html(url):
     """Fetch HTML from a URL with basic error handling."""
+    import requests
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
     }
@@ -67,6 +76,8 @@ def extract_headlines(html, max_items=DEFAULT_TOP_N):
     Extract headlines from HTML.
     Strategy: find all <h1> and <h2> tags, collect unique non-trivial texts.
     """
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     tags = soup.find_all(["h1", "h2"])
 
@@ -95,16 +106,30 @@ def save_to_txt(site_name, headlines):
     print(f"[TXT] Saved to: {filename}")
 
 
-def save_to_pdf(site_name, headlines):
-    ensure_output_dir()
-    ts = timestamp_str()
-    filename = os.path.join(OUTPUT_DIR, f"{site_name}_headlines_{ts}.pdf")
+def pdf_filename(site_name):
+    return os.path.join(OUTPUT_DIR, f"{site_name}_headlines_{timestamp_str()}.pdf")
+
 
+def fpdf_available():
     try:
         from fpdf import FPDF
+        return True
     except ImportError:
         print("[PDF] fpdf is not installed. Run: pip install fpdf")
+        return False
+
+
+def save_to_pdf(site_name, headlines):
+    ensure_output_dir()
+    if not fpdf_available():
         return
+    filename = render_headlines_pdf(pdf_filename(site_name), site_name, headlines, human_time())
+    print(f"[PDF] Saved to: {filename}")
+
+
+def render_headlines_pdf(filename, site_name, headlines, generated_at):
+    """Write one headlines PDF (module level, so worker processes can run it)."""
+    from fpdf import FPDF
 
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
@@ -116,7 +141,7 @@ def save_to_pdf(site_name, headlines):
 
     # Timestamp
     pdf.set_font("Arial", "", 11)
-    pdf.cell(0, 8, f"Generated at: {human_time()}", ln=True)
+    pdf.cell(0, 8, f"Generated at: {generated_at}", ln=True)
     pdf.ln(4)
 
     # Headlines
@@ -126,26 +151,45 @@ def save_to_pdf(site_name, headlines):
         pdf.ln(1)
 
     pdf.output(filename)
-    print(f"[PDF] Saved to: {filename}")
+    return filename
+
+
+def save_pdfs(headlines_by_site, workers=None):
+    """Render one PDF per site at the same time (see shared/jobrunner.py)."""
+    ensure_output_dir()
+    if not headlines_by_site or not fpdf_available():
+        return
+    generated_at = human_time()
+    jobs = [
+        Job(site, render_headlines_pdf, (pdf_filename(site), site, headlines, generated_at))
+        for site, headlines in headlines_by_site.items()
+    ]
+    report = JobRunner(workers=workers, timeout=PDF_JOB_TIMEOUT, preload=["fpdf"]).run(jobs)
+    for result in report.results:
+        if result.ok:
+            print(f"[PDF] Saved to: {result.value}")
+        else:
+            print(f"[PDF] Could not save {result.name}: {result.error}")
+    print(f"[PDF] {report.summary()}")
 
 
 def scrape_site(site_key, top_n=DEFAULT_TOP_N, save_txt=True, save_pdf=False):
     site_key = site_key.lower()
     if site_key not in SITES:
         print("Unknown site:", site_key)
-        return
+        return None
 
     url = SITES[site_key]
     print(f"\nScraping {site_key} -> {url}")
     html = fetch_html(url)
     if not html:
         print("No HTML fetched. Skipping.")
-        return
+        return None
 
     headlines = extract_headlines(html, max_items=top_n)
     if not headlines:
         print("No headlines found.")
-        return
+        return None
 
     print(f"\nTop {len(headlines)} headlines from {site_key}:")
     for i, h in enumerate(headlines, start=1):
@@ -155,11 +199,18 @@ def scrape_site(site_key, top_n=DEFAULT_TOP_N, save_txt=True, save_pdf=False):
         save_to_txt(site_key, headlines)
     if save_pdf:
         save_to_pdf(site_key, headlines)
+    return headlines
 
 
 def scrape_all_sites(top_n=DEFAULT_TOP_N, save_txt=True, save_pdf=False):
+    headlines_by_site = {}
     for site in SITES:
-        scrape_site(site, top_n=top_n, save_txt=save_txt, save_pdf=save_pdf)
+        headlines = scrape_site(site, top_n=top_n, save_txt=save_txt)
+        if headlines:
+            headlines_by_site[site] = headlines
+    # All PDFs are rendered together, in parallel
+    if save_pdf:
+        save_pdfs(headlines_by_site)
 
 
 # --------------- CLI MENU ---------------
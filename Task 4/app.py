@@ -1,10 +1,62 @@
-from flask import Flask, request, jsonify
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+import json
+import threading
+import time
+
+from flask import Flask, request, jsonify, g
 
 app = Flask(__name__)
 
 users = {}
 next_id = 1
 
+# ---------- Indexes ----------
+# user_ids is kept sorted (ids only ever grow), so keyset pagination is a
+# binary search instead of a scan. name_index and age_index map a
+# normalized value to the sorted list of user ids that have it, so a
+# filtered page also starts with a binary search from the cursor. Emails
+# are unique, so email_index maps a normalized email straight to its user id.
+user_ids = []
+name_index = {}
+email_index = {}
+age_index = {}
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+USER_FIELDS = ("id", "name", "email", "age")
+MAX_BATCH_SIZE = 100_000
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/ndjson")
+
+# ---------- Versions & Response Cache ----------
+# Every user has a version that is bumped on each change, and
+# users_version is bumped on any write. They make up the ETags, and the
+# caches below keep already-serialized JSON keyed by the same ETag, so an
+# unchanged resource is never serialized twice.
+user_versions = {}
+users_version = 0
+user_response_cache = OrderedDict()
+list_response_cache = OrderedDict()
+MAX_CACHED_RESPONSES = 1024
+
+# ---------- Metrics Config ----------
+# Latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+# Hot routes only time 1 in N requests (request counts and bytes stay
+# exact). Example: {"/users/<int:user_id>": 10}
+METRICS_SAMPLE_EVERY = {}
+
+
+# Held by every write from its checks to its last change, so writes never
+# interleave: a batch is validated and applied as one step, and no other
+# write can change a user in between. Batch bodies are read before taking
+# it, so a slow upload doesn't hold up other writes.
+store_lock = threading.RLock()
+
 
 def get_next_id():
     global next_id
@@ -13,6 +65,249 @@ def get_next_id():
     return _id
 
 
+def normalize(value):
+    """Normalize a name/email for case-insensitive index lookups."""
+    return str(value).strip().lower()
+
+
+def age_key(age):
+    """Return the index key for an age, or None if it can't be indexed."""
+    if isinstance(age, bool) or not isinstance(age, (int, float)):
+        return None
+    return age
+
+
+def index_buckets(user):
+    """(index, key) of every sorted-id-list index the user belongs in."""
+    buckets = [(name_index, normalize(user["name"]))]
+    key = age_key(user["age"])
+    if key is not None:
+        buckets.append((age_index, key))
+    return buckets
+
+
+def contains_id(ids, user_id):
+    """Binary search in a sorted id list."""
+    i = bisect_left(ids, user_id)
+    return i < len(ids) and ids[i] == user_id
+
+
+def index_user(user):
+    """Add a user to every secondary index."""
+    email_index[normalize(user["email"])] = user["id"]
+    for index, key in index_buckets(user):
+        ids = index.setdefault(key, [])
+        # New users have the highest id, so this is usually an append
+        if not ids or ids[-1] < user["id"]:
+            ids.append(user["id"])
+        else:
+            insort(ids, user["id"])
+
+
+def unindex_email(user):
+    email = normalize(user["email"])
+    # A bulk update may already have handed this email to another user
+    if email_index.get(email) == user["id"]:
+        del email_index[email]
+
+
+def unindex_user(user):
+    """Remove a user from every secondary index."""
+    unindex_email(user)
+    for index, key in index_buckets(user):
+        ids = index.get(key)
+        if ids is None or not contains_id(ids, user["id"]):
+            continue
+        del ids[bisect_left(ids, user["id"])]
+        if not ids:
+            del index[key]
+
+
+def email_owner(email):
+    """Return the id of the user with this email (case-insensitive), or None."""
+    return email_index.get(normalize(email))
+
+
+def user_etag(user_id):
+    return f"user-{user_id}-v{user_versions[user_id]}"
+
+
+def users_changed(user_id):
+    """Invalidate cached responses after a user was created/updated/deleted."""
+    global users_version
+    users_version += 1
+    user_response_cache.pop(user_id, None)
+    list_response_cache.clear()
+
+
+def conditional_json(cache, key, etag, build):
+    """
+    Return a JSON response with a strong ETag.
+
+    Answers 304 when the client already has this version, otherwise reuses
+    the cached body for this ETag or calls build() and caches the result.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+
+    cached = cache.get(key)
+    if cached is None or cached[0] != etag:
+        cached = (etag, app.json.dumps(build()) + "\n")
+        cache[key] = cached
+        if len(cache) > MAX_CACHED_RESPONSES:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+
+    response = app.response_class(cached[1], mimetype="application/json")
+    response.set_etag(etag)
+    return response
+
+
+def parse_int_arg(name, default=None):
+    """Read an integer query parameter, raising ValueError with a message."""
+    raw = request.args.get(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+def validate_new_user(data):
+    """Return an error message if data can't be used to create a user."""
+    if not isinstance(data, dict):
+        return "item must be a JSON object"
+    if not data.get("name") or not data.get("email"):
+        return "name and email are required"
+    return None
+
+
+def validate_update(data):
+    """Return an error message if data can't be applied to an existing user."""
+    if not isinstance(data, dict):
+        return "item must be a JSON object"
+    # Same rule as on create: null or "" would be indexed as a real value
+    for field in ("name", "email"):
+        if field in data and not data[field]:
+            return f"{field} can't be empty"
+    return None
+
+
+# ---------- Metrics ----------
+class Histogram:
+    """Prometheus-style histogram: per-bucket counts plus sum and count."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+metrics_lock = threading.Lock()
+in_flight = 0
+request_counts = {}      # (method, route, status) -> count
+request_bytes = {}       # (method, route) -> bytes received
+response_bytes = {}      # (method, route) -> bytes sent
+request_latency = {}     # (method, route) -> Histogram
+route_hits = {}          # (method, route) -> requests seen, for sampling
+store_latency = {}       # operation -> Histogram
+
+
+def timed_store_op(func):
+    """Record how long a store helper takes in store_latency."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with metrics_lock:
+                hist = store_latency.get(func.__name__)
+                if hist is None:
+                    hist = store_latency[func.__name__] = Histogram()
+                hist.observe(elapsed)
+    return wrapper
+
+
+# ---------- Store Helpers ----------
+@timed_store_op
+def insert_user(data):
+    user_id = get_next_id()
+    user = {
+        "id": user_id,
+        "name": data.get("name"),
+        "email": data.get("email"),
+        "age": data.get("age")
+    }
+    users[user_id] = user
+    user_ids.append(user_id)
+    index_user(user)
+    user_versions[user_id] = 1
+    users_changed(user_id)
+    return user
+
+
+@timed_store_op
+def apply_update(user, data):
+    unindex_user(user)
+    if "name" in data:
+        user["name"] = data["name"]
+    if "email" in data:
+        user["email"] = data["email"]
+    if "age" in data:
+        user["age"] = data["age"]
+    index_user(user)
+    user_versions[user["id"]] += 1
+    users_changed(user["id"])
+
+
+@timed_store_op
+def remove_user(user):
+    unindex_user(user)
+    del users[user["id"]]
+    del user_ids[bisect_left(user_ids, user["id"])]
+    del user_versions[user["id"]]
+    users_changed(user["id"])
+
+
+@timed_store_op
+def remove_users(ids):
+    """Remove many users, rebuilding user_ids and each touched index list once."""
+    removed = set(ids)
+    touched = {}  # (id(index), key) -> (index, key)
+    for user_id in ids:
+        user = users.pop(user_id)
+        unindex_email(user)
+        for index, key in index_buckets(user):
+            touched[id(index), key] = (index, key)
+        del user_versions[user_id]
+        users_changed(user_id)
+    for index, key in touched.values():
+        kept = [uid for uid in index.get(key, ()) if uid not in removed]
+        if kept:
+            index[key] = kept
+        else:
+            index.pop(key, None)
+    user_ids[:] = [uid for uid in user_ids if uid not in removed]
+
+
+def select_fields(user, fields):
+    if fields is None:
+        return user
+    return {key: user[key] for key in fields}
+
+
 @app.route("/")
 def home():
     return jsonify({"message": "User API is running"})
@@ -20,7 +315,77 @@ def home():
 
 @app.route("/users", methods=["GET"])
 def get_users():
-    return jsonify(list(users.values())), 200
+    query_hash = hashlib.sha1(request.query_string).hexdigest()[:16]
+    etag = f"users-v{users_version}-{query_hash}"
+    try:
+        return conditional_json(
+            list_response_cache, request.query_string, etag, build_users_page
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+def build_users_page():
+    """
+    Build one page of GET /users.
+
+    Query parameters:
+    - limit:  page size (default 50, max 500)
+    - cursor: next_cursor from the previous page
+    - name, email, age: exact-match filters (name/email are case-insensitive)
+    - fields: comma-separated subset of id,name,email,age
+
+    Raises ValueError for invalid query parameters.
+    """
+    limit = parse_int_arg("limit", DEFAULT_PAGE_SIZE)
+    after = parse_int_arg("cursor", 0)
+    age = parse_int_arg("age")
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    fields = None
+    if request.args.get("fields"):
+        fields = [f.strip() for f in request.args["fields"].split(",") if f.strip()]
+        unknown = [f for f in fields if f not in USER_FIELDS]
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(unknown)}")
+
+    # Collect the sorted id lists of every active filter, smallest first
+    candidates = []
+    if request.args.get("name"):
+        candidates.append(name_index.get(normalize(request.args["name"]), []))
+    if request.args.get("email"):
+        owner = email_owner(request.args["email"])
+        candidates.append([owner] if owner is not None else [])
+    if age is not None:
+        candidates.append(age_index.get(age, []))
+
+    # Fetch one extra id to know whether there is a next page
+    if candidates:
+        # Walk the smallest list from the cursor; the others are only
+        # binary-searched, so a page never looks at earlier matches
+        candidates.sort(key=len)
+        smallest, rest = candidates[0], candidates[1:]
+        page_ids = []
+        for pos in range(bisect_right(smallest, after), len(smallest)):
+            uid = smallest[pos]
+            if all(contains_id(ids, uid) for ids in rest):
+                page_ids.append(uid)
+                if len(page_ids) > limit:
+                    break
+    else:
+        start = bisect_right(user_ids, after)
+        page_ids = user_ids[start:start + limit + 1]
+
+    next_cursor = None
+    if len(page_ids) > limit:
+        page_ids = page_ids[:limit]
+        next_cursor = str(page_ids[-1])
+
+    return {
+        "users": [select_fields(users[uid], fields) for uid in page_ids],
+        "next_cursor": next_cursor,
+    }
 
 
 @app.route("/users/<int:user_id>", methods=["GET"])
@@ -28,7 +393,26 @@ def get_user(user_id):
     user = users.get(user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
-    return jsonify(user), 200
+    return conditional_json(
+        user_response_cache, user_id, user_etag(user_id), lambda: user
+    )
+
+
+@app.route("/users/by-email/<email>", methods=["GET"])
+def get_user_by_email(email):
+    user_id = email_owner(email)
+    if user_id is None:
+        return jsonify({"error": "User not found"}), 404
+    return conditional_json(
+        user_response_cache, user_id, user_etag(user_id), lambda: users[user_id]
+    )
+
+
+def precondition_failed(user_id):
+    """Return a 412 response if If-Match doesn't match the user's ETag."""
+    if request.if_match and not request.if_match.contains(user_etag(user_id)):
+        return jsonify({"error": "User was modified by another request"}), 412
+    return None
 
 
 @app.route("/users", methods=["POST"])
@@ -37,52 +421,323 @@ def create_user():
     if not data:
         return jsonify({"error": "JSON body required"}), 400
 
-    name = data.get("name")
-    email = data.get("email")
-    age = data.get("age")
+    error = validate_new_user(data)
+    if error:
+        return jsonify({"error": error}), 400
+    with store_lock:
+        if email_owner(data["email"]) is not None:
+            return jsonify({"error": "email already exists"}), 409
 
-    if not name or not email:
-        return jsonify({"error": "name and email are required"}), 400
-
-    user_id = get_next_id()
-    user = {
-        "id": user_id,
-        "name": name,
-        "email": email,
-        "age": age
-    }
-    users[user_id] = user
-    return jsonify(user), 201
+        user = insert_user(data)
+        response = jsonify(user)
+        response.set_etag(user_etag(user["id"]))
+        return response, 201
 
 
 @app.route("/users/<int:user_id>", methods=["PUT"])
 def update_user(user_id):
-    user = users.get(user_id)
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    with store_lock:
+        user = users.get(user_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
 
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "JSON body required"}), 400
+        failed = precondition_failed(user_id)
+        if failed:
+            return failed
 
-    if "name" in data:
-        user["name"] = data["name"]
-    if "email" in data:
-        user["email"] = data["email"]
-    if "age" in data:
-        user["age"] = data["age"]
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "JSON body required"}), 400
+        error = validate_update(data)
+        if error:
+            return jsonify({"error": error}), 400
+        if "email" in data and email_owner(data["email"]) not in (None, user_id):
+            return jsonify({"error": "email already exists"}), 409
 
-    return jsonify(user), 200
+        apply_update(user, data)
+        response = jsonify(user)
+        response.set_etag(user_etag(user_id))
+        return response, 200
 
 
 @app.route("/users/<int:user_id>", methods=["DELETE"])
 def delete_user(user_id):
-    user = users.get(user_id)
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    with store_lock:
+        user = users.get(user_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        failed = precondition_failed(user_id)
+        if failed:
+            return failed
+
+        remove_user(user)
+        return jsonify({"message": f"User {user_id} deleted"}), 200
+
+
+# ---------- Bulk Endpoints ----------
+# Each batch is validated as a whole before anything is written, so a
+# batch is either applied completely or not at all. Bodies can be a JSON
+# array or NDJSON (one JSON object per line, Content-Type
+# application/x-ndjson).
+def read_batch():
+    """Return the list of items in the request body, or raise ValueError."""
+    if request.mimetype in NDJSON_MIMETYPES:
+        items = []
+        for line_no, line in enumerate(request.stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            # Stop reading as soon as the batch is too big
+            if len(items) >= MAX_BATCH_SIZE:
+                raise ValueError(f"batch is larger than {MAX_BATCH_SIZE} items")
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                raise ValueError(f"invalid JSON on line {line_no}")
+    else:
+        items = request.get_json(silent=True)
+        if not isinstance(items, list):
+            raise ValueError("JSON array or NDJSON body required")
+
+    if not items:
+        raise ValueError("batch is empty")
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"batch is larger than {MAX_BATCH_SIZE} items")
+    return items
+
+
+def is_user_id(value):
+    # bool is an int subclass: True would otherwise match user 1
+    return isinstance(value, int) and not isinstance(value, bool) and value in users
+
+
+def batch_response(errors, results, status):
+    if errors:
+        return jsonify({
+            "error": "batch rejected, nothing was applied",
+            "errors": errors,
+        }), 400
+    return jsonify({"results": results}), status
+
+
+@app.route("/users:batch", methods=["POST"])
+def create_users_batch():
+    try:
+        items = read_batch()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    with store_lock:
+        errors = []
+        batch_emails = set()
+        for i, data in enumerate(items):
+            error = validate_new_user(data)
+            if error:
+                errors.append({"index": i, "error": error})
+                continue
+            email = normalize(data["email"])
+            if email in email_index or email in batch_emails:
+                errors.append({"index": i, "error": "email already exists"})
+            batch_emails.add(email)
+        if errors:
+            return batch_response(errors, None, 400)
+
+        results = [
+            {"index": i, "status": 201, "id": insert_user(data)["id"]}
+            for i, data in enumerate(items)
+        ]
+        return batch_response(None, results, 201)
+
+
+@app.route("/users:batch", methods=["PATCH"])
+def update_users_batch():
+    """Each item is {"id": <user id>, ...fields to change}."""
+    try:
+        items = read_batch()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    with store_lock:
+        errors = []
+        seen = set()
+        for i, data in enumerate(items):
+            error = validate_update(data)
+            if error:
+                errors.append({"index": i, "error": error})
+            elif not is_user_id(data.get("id")):
+                errors.append({"index": i, "error": "User not found"})
+            elif data["id"] in seen:
+                errors.append({"index": i, "error": "duplicate id in batch"})
+            else:
+                seen.add(data["id"])
+        if errors:
+            return batch_response(errors, None, 400)
+
+        # Emails must still be unique once the whole batch is applied. An
+        # email may move to another user if its owner changes email in the
+        # same batch.
+        changing = {data["id"] for data in items if "email" in data}
+        claimed = set()
+        for i, data in enumerate(items):
+            if "email" not in data:
+                continue
+            email = normalize(data["email"])
+            owner = email_index.get(email)
+            taken = owner not in (None, data["id"]) and owner not in changing
+            if email in claimed or taken:
+                errors.append({"index": i, "error": "email already exists"})
+            claimed.add(email)
+        if errors:
+            return batch_response(errors, None, 400)
+
+        results = []
+        for i, data in enumerate(items):
+            apply_update(users[data["id"]], data)
+            results.append({"index": i, "status": 200, "id": data["id"]})
+        return batch_response(None, results, 200)
+
+
+@app.route("/users:batch", methods=["DELETE"])
+def delete_users_batch():
+    """Each item is a user id (or {"id": <user id>})."""
+    try:
+        items = read_batch()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    with store_lock:
+        errors = []
+        ids = []
+        seen = set()
+        for i, item in enumerate(items):
+            user_id = item.get("id") if isinstance(item, dict) else item
+            if not is_user_id(user_id):
+                errors.append({"index": i, "error": "User not found"})
+                continue
+            if user_id in seen:
+                errors.append({"index": i, "error": "duplicate id in batch"})
+            seen.add(user_id)
+            ids.append(user_id)
+        if errors:
+            return batch_response(errors, None, 400)
+
+        remove_users(ids)
+        results = [
+            {"index": i, "status": 200, "id": user_id}
+            for i, user_id in enumerate(ids)
+        ]
+        return batch_response(None, results, 200)
+
+
+# ---------- Request Metrics ----------
+@app.before_request
+def start_request_timer():
+    global in_flight
+    route = request.url_rule.rule if request.url_rule else "<unmatched>"
+    key = (request.method, route)
+    with metrics_lock:
+        in_flight += 1
+        hits = route_hits.get(key, 0)
+        route_hits[key] = hits + 1
+    g.metrics_key = key
+    if hits % METRICS_SAMPLE_EVERY.get(route, 1) == 0:
+        g.metrics_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    key = g.get("metrics_key")
+    if key is None:
+        return response
+    start = g.get("metrics_start")
+    elapsed = time.perf_counter() - start if start is not None else None
+    sent = response.calculate_content_length() or 0
+    with metrics_lock:
+        count_key = key + (response.status_code,)
+        request_counts[count_key] = request_counts.get(count_key, 0) + 1
+        request_bytes[key] = request_bytes.get(key, 0) + (request.content_length or 0)
+        response_bytes[key] = response_bytes.get(key, 0) + sent
+        if elapsed is not None:
+            hist = request_latency.get(key)
+            if hist is None:
+                hist = request_latency[key] = Histogram()
+            hist.observe(elapsed)
+    return response
+
+
+@app.teardown_request
+def finish_request(exc):
+    global in_flight
+    if g.get("metrics_key") is not None:
+        with metrics_lock:
+            in_flight -= 1
+
+
+def labels(**pairs):
+    """Format Prometheus labels, escaping backslashes and quotes."""
+    inner = []
+    for name, value in pairs.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        inner.append(f'{name}="{value}"')
+    return "{" + ",".join(inner) + "}"
+
+
+def histogram_lines(name, hist, **pairs):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(hist.buckets + ("+Inf",), hist.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{labels(**pairs, le=bound)} {cumulative}")
+    lines.append(f"{name}_sum{labels(**pairs)} {hist.sum}")
+    lines.append(f"{name}_count{labels(**pairs)} {hist.count}")
+    return lines
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Expose request and store metrics in Prometheus text format."""
+    with metrics_lock:
+        lines = [
+            "# HELP http_requests_in_flight Requests currently being handled.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+            "# HELP http_requests_total Requests by method, route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in request_counts.items():
+            lines.append(
+                f"http_requests_total{labels(method=method, route=route, status=status)} {count}"
+            )
+
+        for name, table, help_text in (
+            ("http_request_bytes_total", request_bytes, "Request body bytes received."),
+            ("http_response_bytes_total", response_bytes, "Response body bytes sent."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (method, route), total in table.items():
+                lines.append(f"{name}{labels(method=method, route=route)} {total}")
+
+        lines.append("# HELP http_request_duration_seconds Request latency (sampled on hot routes).")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for (method, route), hist in request_latency.items():
+            lines.extend(histogram_lines(
+                "http_request_duration_seconds", hist, method=method, route=route
+            ))
+
+        lines.append("# HELP store_operation_duration_seconds Time spent in store helpers.")
+        lines.append("# TYPE store_operation_duration_seconds histogram")
+        for operation, hist in store_latency.items():
+            lines.extend(histogram_lines(
+                "store_operation_duration_seconds", hist, operation=operation
+            ))
 
-    del users[user_id]
-    return jsonify({"message": f"User {user_id} deleted"}), 200
+    return app.response_class(
+        "\n".join(lines) + "\n",
+        mimetype="text/plain",
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+# benchmark.py
+"""
+Benchmarks for the Task 5 sales tools.
+
+Generates a synthetic sales CSV (same columns as sales_data.csv, any
+number of rows) and times:
+
+- cache:    parsing the CSV vs. reading the Parquet cache (full, a few
+            columns, and one category over one month)
+- validate: rows/sec of the vectorized validation stage, on data with a
+            share of deliberately broken rows
+
+Usage:
+    python benchmark.py generate --rows 5000000 --output big_sales.csv
+    python benchmark.py cache --rows 2000000
+    python benchmark.py cache --csv big_sales.csv
+    python benchmark.py validate --rows 3000000 --error-rate 0.001
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from sales_analysis import load_sales
+
+# --------------- SYNTHETIC DATA ---------------
+
+# (Product, Category, unit price) – based on the products in sales_data.csv
+PRODUCTS = [
+    ("Phone", "Electronics", 15000),
+    ("Laptop", "Electronics", 55000),
+    ("Headphones", "Electronics", 2000),
+    ("Shoes", "Fashion", 1200),
+    ("T-Shirt", "Fashion", 500),
+    ("Jeans", "Fashion", 1500),
+    ("Mixer", "Home Appliances", 3500),
+    ("Refrigerator", "Home Appliances", 30000),
+    ("Microwave", "Home Appliances", 9000),
+]
+CITIES = ["Hyderabad", "Bengaluru", "Chennai", "Delhi", "Mumbai", "Pune", "Kolkata"]
+GENERATE_CHUNK = 500_000
+
+
+def generate_sales_csv(path, rows, seed=42, start_date="2024-01-01", days=365, error_rate=0.0):
+    """
+    Write `rows` random orders to path, chunk by chunk.
+    With error_rate > 0 that share of rows is broken on purpose (wrong
+    Total, repeated OrderID, impossible Date or non-numeric Quantity).
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array([p[0] for p in PRODUCTS])
+    categories = np.array([p[1] for p in PRODUCTS])
+    prices = np.array([p[2] for p in PRODUCTS])
+    cities = np.array(CITIES)
+    start = np.datetime64(start_date)
+
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        while written < rows:
+            n = min(GENERATE_CHUNK, rows - written)
+            product = rng.integers(0, len(PRODUCTS), n)
+            quantity = rng.integers(1, 6, n)
+            chunk = pd.DataFrame({
+                "OrderID": np.arange(1001 + written, 1001 + written + n),
+                "Date": (start + rng.integers(0, days, n)).astype("datetime64[D]"),
+                "Product": names[product],
+                "Category": categories[product],
+                "Quantity": quantity,
+                "Price": prices[product],
+                "Total": quantity * prices[product],
+                "City": cities[rng.integers(0, len(cities), n)],
+            })
+            if error_rate:
+                corrupt_chunk(chunk, rng, error_rate)
+            chunk.to_csv(f, index=False, header=written == 0)
+            written += n
+    return path
+
+
+def corrupt_chunk(chunk, rng, error_rate):
+    """Break about error_rate of the rows, spread over four kinds of error."""
+    broken = np.flatnonzero(rng.random(len(chunk)) < error_rate)
+    kinds = np.array_split(rng.permutation(broken), 4)
+    chunk.loc[kinds[0], "Total"] += 1
+    chunk.loc[kinds[1][kinds[1] > 0], "OrderID"] = chunk["OrderID"].iloc[0]
+    chunk["Date"] = chunk["Date"].astype(str)
+    chunk.loc[kinds[2], "Date"] = "2024-13-45"
+    chunk["Quantity"] = chunk["Quantity"].astype(object)
+    chunk.loc[kinds[3], "Quantity"] = "two"
+
+
+# --------------- HELPERS ---------------
+
+def timed(label, func, repeat=3):
+    """Run func `repeat` times and return (best seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:40} {best:9.3f} s")
+    return best, result
+
+
+def prepare_csv(args, tmp_dir):
+    if args.csv:
+        return args.csv
+    path = os.path.join(tmp_dir, "sales_synthetic.csv")
+    print(f"[INFO] Generating {args.rows:,} synthetic rows...")
+    generate_sales_csv(path, args.rows)
+    return path
+
+
+# --------------- BENCHMARKS ---------------
+
+def bench_cache(args):
+    from sales_cache import build_cache, read_cache
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = prepare_csv(args, tmp_dir)
+        cache_dir = os.path.join(tmp_dir, "cache")
+        print(f"[INFO] CSV size: {os.path.getsize(csv_path) / 1e6:.1f} MB")
+        print("-" * 52)
+
+        timed("Build Parquet cache (one time)", lambda: build_cache(csv_path, cache_dir), repeat=1)
+        csv_time, df = timed("Parse CSV (pd.read_csv, all columns)", lambda: load_sales(csv_path))
+        rows = len(df)
+        del df
+
+        cases = [
+            ("Cache: all columns", {}),
+            ("Cache: Category + Total", {"columns": ["Category", "Total"]}),
+            ("Cache: Fashion, 2024-03 only", {
+                "start": "2024-03-01", "end": "2024-03-31", "categories": ["Fashion"],
+            }),
+        ]
+        print("-" * 52)
+        for label, kwargs in cases:
+            seconds, df = timed(label, lambda: read_cache(cache_dir, **kwargs))
+            print(f"{'':40} {len(df):>9,} rows, {csv_time / seconds:6.1f}x faster than CSV")
+
+        print("-" * 52)
+        print(f"[DONE] {rows:,} rows")
+
+
+def bench_validate(args):
+    from sales_validation import read_valid_sales_chunks
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.csv:
+            csv_path = args.csv
+        else:
+            csv_path = os.path.join(tmp_dir, "sales_synthetic.csv")
+            print(f"[INFO] Generating {args.rows:,} synthetic rows "
+                  f"({args.error_rate:.2%} broken)...")
+            generate_sales_csv(csv_path, args.rows, error_rate=args.error_rate)
+        quarantine = os.path.join(tmp_dir, "bad_rows.csv")
+
+        stats = {}
+        start = time.perf_counter()
+        clean_rows = sum(
+            len(chunk) for chunk in read_valid_sales_chunks(csv_path, quarantine_path=quarantine, stats=stats)
+        )
+        elapsed = time.perf_counter() - start
+
+        print("-" * 52)
+        print(f"{'Rows checked':30} {stats['rows']:>14,}")
+        print(f"{'Rows accepted':30} {clean_rows:>14,}")
+        print(f"{'Rows quarantined':30} {stats['rejected']:>14,}")
+        print(f"{'Total time (parse + validate)':30} {elapsed:>12.3f} s")
+        print(f"{'Validation time':30} {stats['validate_seconds']:>12.3f} s")
+        print("-" * 52)
+        print(f"{'Overall throughput':30} {stats['rows'] / elapsed:>14,.0f} rows/sec")
+        print(f"{'Validation throughput':30} "
+              f"{stats['rows'] / stats['validate_seconds']:>14,.0f} rows/sec")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks for the Task 5 sales tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Write a synthetic sales CSV")
+    gen.add_argument("--rows", type=int, default=1_000_000)
+    gen.add_argument("--output", default="sales_synthetic.csv")
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--error-rate", type=float, default=0.0, help="Share of rows to break on purpose")
+
+    cache = sub.add_parser("cache", help="CSV parsing vs. Parquet cache reads")
+    cache.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows to generate")
+    cache.add_argument("--csv", help="Use this CSV instead of generating one")
+
+    validate = sub.add_parser("validate", help="Throughput of the validation stage")
+    validate.add_argument("--rows", type=int, default=2_000_000, help="Synthetic rows to generate")
+    validate.add_argument("--error-rate", type=float, default=0.001, help="Share of broken rows")
+    validate.add_argument("--csv", help="Use this CSV instead of generating one")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "generate":
+        generate_sales_csv(args.output, args.rows, seed=args.seed, error_rate=args.error_rate)
+        print(f"[DONE] Wrote {args.rows:,} rows to {args.output}")
+    elif args.command == "cache":
+        bench_cache(args)
+    elif args.command == "validate":
+        bench_validate(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# sales_analysis.py
+"""
+Task 5: Sales Data Analysis (importable module)
+
+The same analysis as sales_analysis.ipynb, but streaming:
+- Reads the CSV in chunks, so memory stays bounded for files of any size
+- Uses compact dtypes (categoricals for Category/City/Product, int32 Quantity)
+- Group-by aggregates (sum/count/mean) are combined across chunks
+
+Usage:
+    from sales_analysis import category_sales, aggregate_sales
+    category_sales("sales_data.csv")
+    aggregate_sales("sales_data.csv", by=["City", "Category"])
+
+CLI:
+    python sales_analysis.py sales_data.csv --by Category --chunksize 500000
+"""
+
+import argparse
+
+import pandas as pd
+
+# --------------- CONFIG ---------------
+
+SALES_FILE = "sales_data.csv"
+DEFAULT_CHUNKSIZE = 500_000  # rows per chunk
+
+SALES_DTYPES = {
+    "OrderID": "int64",
+    "Product": "category",
+    "Category": "category",
+    "City": "category",
+    "Quantity": "int32",
+    "Price": "float64",
+    "Total": "float64",
+}
+DATE_COLUMNS = ["Date"]
+VALUE_COLUMNS = ("Quantity", "Total")
+
+
+# --------------- LOADING ---------------
+
+def read_sales_chunks(path=SALES_FILE, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """
+    Return an iterator of DataFrame chunks with compact dtypes.
+    Pass usecols to parse only the columns you need.
+    """
+    if usecols is None:
+        dtypes = SALES_DTYPES
+        parse_dates = DATE_COLUMNS
+    else:
+        dtypes = {col: t for col, t in SALES_DTYPES.items() if col in usecols}
+        parse_dates = [col for col in DATE_COLUMNS if col in usecols]
+
+    return pd.read_csv(
+        path,
+        dtype=dtypes,
+        usecols=usecols,
+        parse_dates=parse_dates or False,
+        chunksize=chunksize,
+    )
+
+
+def load_sales(path=SALES_FILE):
+    """Load the whole file at once (only for data that fits in memory)."""
+    return pd.read_csv(path, dtype=SALES_DTYPES, parse_dates=DATE_COLUMNS)
+
+
+# --------------- AGGREGATION ---------------
+
+def aggregate_sales(path=SALES_FILE, by="Category", values=VALUE_COLUMNS,
+                    chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Group the sales file by one or more columns in a single streaming pass.
+
+    Returns a DataFrame indexed by the group columns with:
+    orders, <value>_sum and <value>_mean for every value column.
+    Only per-group partial sums are kept between chunks, so memory depends
+    on the number of groups, not the number of rows.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    values = list(values)
+    usecols = by + [v for v in values if v not in by]
+
+    sums = None
+    counts = None
+    for chunk in read_sales_chunks(path, chunksize=chunksize, usecols=usecols):
+        grouped = chunk.groupby(by, observed=True)
+        # float64 sums so int32 quantities can't overflow across chunks
+        part_sums = grouped[values].sum().astype("float64")
+        part_counts = grouped.size()
+        # Category sets differ between chunks; plain labels align cleanly
+        part_sums.index = plain_index(part_sums.index)
+        part_counts.index = plain_index(part_counts.index)
+
+        if sums is None:
+            sums, counts = part_sums, part_counts
+        else:
+            sums = sums.add(part_sums, fill_value=0)
+            counts = counts.add(part_counts, fill_value=0)
+
+    if sums is None:
+        columns = ["orders"] + [f"{v}_{agg}" for v in values for agg in ("sum", "mean")]
+        return pd.DataFrame(columns=columns)
+
+    result = pd.DataFrame({"orders": counts.astype("int64")})
+    for v in values:
+        result[f"{v}_sum"] = sums[v]
+        result[f"{v}_mean"] = sums[v] / result["orders"]
+    result.index.names = by
+    return result.sort_index()
+
+
+def plain_index(index):
+    """Turn categorical index levels into plain object labels."""
+    if isinstance(index, pd.MultiIndex):
+        return pd.MultiIndex.from_arrays(
+            [index.get_level_values(i).astype(object) for i in range(index.nlevels)],
+            names=index.names,
+        )
+    return index.astype(object)
+
+
+def category_sales(path=SALES_FILE, chunksize=DEFAULT_CHUNKSIZE):
+    """Total sales by Category (same result as the notebook's groupby)."""
+    return aggregate_sales(path, by="Category", values=["Total"], chunksize=chunksize)["Total_sum"]
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Streaming sales analysis – group-by aggregates for CSVs larger than memory."
+    )
+    parser.add_argument("path", nargs="?", default=SALES_FILE, help="Sales CSV file")
+    parser.add_argument(
+        "--by", nargs="+", default=["Category"],
+        help="Column(s) to group by (e.g. --by City Category)",
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = aggregate_sales(args.path, by=args.by, chunksize=args.chunksize)
+    with pd.option_context("display.max_rows", None, "display.max_columns", None,
+                           "display.width", 160):
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# sales_cache.py
+"""
+Columnar Parquet cache for sales_data.csv
+
+Parsing a big CSV is slow, so the first run converts it into a Parquet
+dataset partitioned by Month and Category:
+
+    sales_data.parquet_cache/
+        Month=2024-01/Category=Electronics/part-0-0.parquet
+        ...
+        _source.json            # size/mtime of the CSV the cache was built from
+
+Later reads:
+- rebuild the cache automatically when the CSV is newer (or changed size)
+- load only the columns you ask for
+- skip whole partitions for date-range and category filters
+
+Usage:
+    from sales_cache import load_sales_cached
+    df = load_sales_cached("sales_data.csv", columns=["Category", "Total"],
+                           start="2024-02-01", categories=["Fashion"])
+
+CLI:
+    python sales_cache.py sales_data.csv           # build / refresh the cache
+    python sales_cache.py sales_data.csv --force   # always rebuild
+
+Requires: pip install pyarrow
+"""
+
+import argparse
+import json
+import os
+import shutil
+
+import pandas as pd
+
+from sales_analysis import DEFAULT_CHUNKSIZE, SALES_FILE, read_sales_chunks
+
+# --------------- CONFIG ---------------
+
+CACHE_SUFFIX = ".parquet_cache"
+MANIFEST_FILE = "_source.json"
+PARTITION_COLUMNS = ["Month", "Category"]
+CATEGORY_COLUMNS = ["Product", "Category", "City"]
+SALES_COLUMNS = ["OrderID", "Date", "Product", "Category", "Quantity", "Price", "Total", "City"]
+
+
+def default_cache_dir(csv_path):
+    """sales_data.csv -> sales_data.parquet_cache (next to the CSV)."""
+    return os.path.splitext(csv_path)[0] + CACHE_SUFFIX
+
+
+def require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("The Parquet cache requires 'pyarrow'. Install with: pip install pyarrow")
+
+
+# --------------- BUILD ---------------
+
+def source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def is_cache_fresh(csv_path, cache_dir=None):
+    """True if the cache exists and was built from the current CSV."""
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    manifest = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest):
+        return False
+    with open(manifest, encoding="utf-8") as f:
+        built_from = json.load(f)
+    return built_from == source_stamp(csv_path)
+
+
+def build_cache(csv_path=SALES_FILE, cache_dir=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Convert the CSV into a partitioned Parquet dataset, one chunk at a time.
+    The new cache is written next to the old one and swapped in at the end,
+    so readers never see a half-written cache.
+    """
+    require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    stamp = source_stamp(csv_path)
+    tmp_dir = cache_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    rows = 0
+    for i, chunk in enumerate(read_sales_chunks(csv_path, chunksize=chunksize)):
+        # numpy month truncation is much faster than .dt.strftime
+        chunk["Month"] = chunk["Date"].to_numpy().astype("datetime64[M]").astype(str)
+        # Partition values become directory names, so store them as strings
+        chunk["Category"] = chunk["Category"].astype(str)
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        pq.write_to_dataset(
+            table,
+            tmp_dir,
+            partition_cols=PARTITION_COLUMNS,
+            basename_template=f"part-{i}-{{i}}.parquet",
+        )
+        rows += len(chunk)
+
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(stamp, f)
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+    return rows
+
+
+def ensure_cache(csv_path=SALES_FILE, cache_dir=None, force=False):
+    """Build the cache if it is missing or older than the CSV. Returns the cache dir."""
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    if force or not is_cache_fresh(csv_path, cache_dir):
+        build_cache(csv_path, cache_dir)
+    return cache_dir
+
+
+# --------------- READ ---------------
+
+def month_of(value):
+    return pd.Timestamp(value).strftime("%Y-%m")
+
+
+def read_cache(cache_dir, columns=None, start=None, end=None, categories=None):
+    """
+    Read the Parquet cache into a DataFrame.
+
+    columns:    only load these columns (default: all CSV columns)
+    start, end: inclusive date range; whole months outside it are skipped
+    categories: only load these categories; other partitions are skipped
+    """
+    require_pyarrow()
+    import pyarrow.dataset as ds
+
+    # Dictionary-encoded partition values load straight into categoricals
+    partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
+    dataset = ds.dataset(cache_dir, format="parquet", partitioning=partitioning)
+
+    # Month/Category filters prune partitions; the Date filter trims the edges
+    filters = []
+    if start is not None:
+        filters.append(ds.field("Month") >= month_of(start))
+        filters.append(ds.field("Date") >= pd.Timestamp(start))
+    if end is not None:
+        filters.append(ds.field("Month") <= month_of(end))
+        filters.append(ds.field("Date") <= pd.Timestamp(end))
+    if categories is not None:
+        filters.append(ds.field("Category").isin(list(categories)))
+
+    expression = None
+    for f in filters:
+        expression = f if expression is None else expression & f
+
+    if columns is None:
+        columns = SALES_COLUMNS
+    df = dataset.to_table(columns=list(columns), filter=expression).to_pandas()
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def load_sales_cached(csv_path=SALES_FILE, cache_dir=None, columns=None,
+                      start=None, end=None, categories=None):
+    """Refresh the cache if needed, then read it (see read_cache for filters)."""
+    cache_dir = ensure_cache(csv_path, cache_dir)
+    return read_cache(cache_dir, columns=columns, start=start, end=end, categories=categories)
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Build or refresh the partitioned Parquet cache for a sales CSV."
+    )
+    parser.add_argument("path", nargs="?", default=SALES_FILE, help="Sales CSV file")
+    parser.add_argument("--cache-dir", default=None, help="Cache folder (default: <csv>.parquet_cache)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the cache is fresh")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cache_dir = args.cache_dir or default_cache_dir(args.path)
+    if not args.force and is_cache_fresh(args.path, cache_dir):
+        print(f"[INFO] Cache is up to date: {cache_dir}")
+        return
+    rows = build_cache(args.path, cache_dir)
+    print(f"[DONE] Cached {rows} rows to {cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+# sales_cube.py
+"""
+Precomputed rollup cube for sales metrics
+
+Instead of re-scanning raw orders for every question, the cube keeps
+orders / Quantity / Total sums for every
+Category x City x Product combination at day, week and month grain.
+Queries group these small tables, never the raw data.
+
+- Build once from the CSV (streaming, chunk by chunk)
+- Add new orders later with update(); orders whose OrderID was already
+  counted are skipped, so re-sending old rows is harmless (IDs don't
+  need to be in order)
+- Save / load the cube between runs
+
+Usage:
+    from sales_cube import SalesCube
+    cube = SalesCube.from_csv("sales_data.csv")
+    cube.query(by=["Category"])                              # Total by Category
+    cube.query(by=["City"], grain="month", Category="Fashion")
+    cube.update(new_orders_df)
+
+CLI:
+    python sales_cube.py build sales_data.csv --output sales_cube.pkl
+    python sales_cube.py update new_orders.csv --cube sales_cube.pkl
+    python sales_cube.py query --cube sales_cube.pkl --by City --grain month --filter Category=Fashion
+"""
+
+import argparse
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from sales_analysis import DEFAULT_CHUNKSIZE, SALES_FILE, plain_index, read_sales_chunks
+from sales_validation import OrderIdTracker
+
+# --------------- CONFIG ---------------
+
+DIMENSIONS = ["Category", "City", "Product"]
+GRAINS = ("day", "week", "month")
+MEASURES = ["orders", "Quantity_sum", "Total_sum"]
+CUBE_FILE = "sales_cube.pkl"
+
+
+def period_start(dates, grain):
+    """Truncate dates to the first day of their day/week/month."""
+    values = dates.to_numpy().astype("datetime64[D]")
+    if grain == "week":
+        # 1970-01-01 was a Thursday; shift so weeks start on Monday
+        values = values - (values.astype("int64") + 3) % 7
+    elif grain == "month":
+        values = values.astype("datetime64[M]").astype("datetime64[D]")
+    return pd.DatetimeIndex(values)
+
+
+class SalesCube:
+    """Sum/count rollups of sales orders at day, week and month grain."""
+
+    def __init__(self):
+        self.tables = {grain: None for grain in GRAINS}
+        self.order_ids = OrderIdTracker()
+        self.rows = 0
+
+    # ---------- Building ----------
+
+    @classmethod
+    def from_csv(cls, path=SALES_FILE, chunksize=DEFAULT_CHUNKSIZE):
+        cube = cls()
+        cube.update_from_csv(path, chunksize)
+        return cube
+
+    def update_from_csv(self, path, chunksize=DEFAULT_CHUNKSIZE):
+        usecols = ["OrderID", "Date", "Quantity", "Total"] + DIMENSIONS
+        added = 0
+        for chunk in read_sales_chunks(path, chunksize=chunksize, usecols=usecols):
+            added += self.update(chunk)
+        return added
+
+    def update(self, orders):
+        """
+        Add new orders (a DataFrame with the sales_data.csv columns).
+        Orders whose OrderID was already counted (earlier, or higher up in
+        the same DataFrame) are skipped. Returns the number of orders added.
+        """
+        ids = orders["OrderID"].to_numpy(dtype="int64")
+        repeated = orders["OrderID"].duplicated().to_numpy() | self.order_ids.seen_before(ids)
+        if repeated.any():
+            orders, ids = orders[~repeated], ids[~repeated]
+        if orders.empty:
+            return 0
+
+        day = period_start(pd.to_datetime(orders["Date"]), "day")
+        frame = pd.DataFrame({
+            "Category": orders["Category"].to_numpy(),
+            "City": orders["City"].to_numpy(),
+            "Product": orders["Product"].to_numpy(),
+            "Period": day,
+            "Quantity_sum": orders["Quantity"].to_numpy(dtype="float64"),
+            "Total_sum": orders["Total"].to_numpy(dtype="float64"),
+        })
+        frame["orders"] = 1
+
+        # Aggregate the new orders once at day grain, then roll that small
+        # partial up to week and month
+        daily = frame.groupby(DIMENSIONS + ["Period"], observed=True)[MEASURES].sum()
+        daily.index = plain_index(daily.index)
+        for grain in GRAINS:
+            if grain == "day":
+                partial = daily
+            else:
+                rolled = daily.reset_index()
+                rolled["Period"] = period_start(rolled["Period"], grain)
+                partial = rolled.groupby(DIMENSIONS + ["Period"])[MEASURES].sum()
+            current = self.tables[grain]
+            self.tables[grain] = partial if current is None else current.add(partial, fill_value=0)
+
+        self.order_ids.add(ids)
+        self.rows += len(orders)
+        return len(orders)
+
+    # ---------- Querying ----------
+
+    def query(self, by=("Category",), grain=None, start=None, end=None, **filters):
+        """
+        Answer a group-by from the cube.
+
+        by:         dimensions to group by (any of Category, City, Product)
+        grain:      None, "day", "week" or "month" – adds a Period column
+        start, end: inclusive date range (use day grain for exact days)
+        filters:    dimension=value or dimension=[values], e.g. City="Delhi"
+
+        Returns orders, Quantity_sum/mean and Total_sum/mean per group.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        unknown = [d for d in by + list(filters) if d not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown dimension(s): {', '.join(unknown)}")
+        if grain is not None and grain not in GRAINS:
+            raise ValueError(f"grain must be one of {', '.join(GRAINS)}")
+
+        # Without a time dimension the month table is the smallest one that
+        # still answers the question (day table if the range needs it)
+        source = grain or ("day" if start is not None or end is not None else "month")
+        table = self.tables[source]
+        if table is None:
+            raise ValueError("The cube is empty – build or update it first")
+        table = table.reset_index()
+
+        mask = np.ones(len(table), dtype=bool)
+        for dim, wanted in filters.items():
+            wanted = [wanted] if isinstance(wanted, str) else list(wanted)
+            mask &= table[dim].isin(wanted).to_numpy()
+        if start is not None:
+            first = period_start(pd.DatetimeIndex([start]), source)[0]
+            mask &= (table["Period"] >= first).to_numpy()
+        if end is not None:
+            mask &= (table["Period"] <= pd.Timestamp(end)).to_numpy()
+        table = table[mask]
+
+        keys = by + (["Period"] if grain else [])
+        if keys:
+            result = table.groupby(keys)[MEASURES].sum()
+        else:
+            result = table[MEASURES].sum().to_frame().T
+        result["orders"] = result["orders"].astype("int64")
+        for measure in ("Quantity", "Total"):
+            result[f"{measure}_mean"] = result[f"{measure}_sum"] / result["orders"]
+        return result[["orders", "Quantity_sum", "Quantity_mean", "Total_sum", "Total_mean"]]
+
+    # ---------- Persistence ----------
+
+    def save(self, path=CUBE_FILE):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path=CUBE_FILE):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+# --------------- CLI ---------------
+
+def parse_filters(pairs):
+    filters = {}
+    for pair in pairs or []:
+        if "=" not in pair:
+            raise SystemExit(f"[ERROR] Filter must look like Dimension=value: {pair}")
+        dim, value = pair.split("=", 1)
+        filters.setdefault(dim, []).append(value)
+    return filters
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Precomputed sales rollup cube.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build a cube from a sales CSV")
+    build.add_argument("path", nargs="?", default=SALES_FILE)
+    build.add_argument("--output", default=CUBE_FILE)
+
+    update = sub.add_parser("update", help="Add new orders from a CSV to a saved cube")
+    update.add_argument("path")
+    update.add_argument("--cube", default=CUBE_FILE)
+
+    query = sub.add_parser("query", help="Query a saved cube")
+    query.add_argument("--cube", default=CUBE_FILE)
+    query.add_argument("--by", nargs="*", default=["Category"])
+    query.add_argument("--grain", choices=GRAINS, default=None)
+    query.add_argument("--start", default=None)
+    query.add_argument("--end", default=None)
+    query.add_argument("--filter", action="append", help="Dimension=value (repeatable)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "build":
+        cube = SalesCube.from_csv(args.path)
+        cube.save(args.output)
+        print(f"[DONE] Built cube from {cube.rows} orders -> {args.output}")
+    elif args.command == "update":
+        cube = SalesCube.load(args.cube)
+        added = cube.update_from_csv(args.path)
+        cube.save(args.cube)
+        print(f"[DONE] Added {added} new orders ({cube.rows} orders in the cube)")
+    elif args.command == "query":
+        cube = SalesCube.load(args.cube)
+        try:
+            result = cube.query(
+                by=args.by, grain=args.grain, start=args.start, end=args.end,
+                **parse_filters(args.filter),
+            )
+        except ValueError as e:
+            raise SystemExit(f"[ERROR] {e}")
+        with pd.option_context("display.max_rows", None, "display.max_columns", None,
+                               "display.width", 160):
+            print(result)
+
+
+if __name__ == "__main__":
+    main()
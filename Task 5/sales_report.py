@@ -0,0 +1,244 @@
+# sales_report.py
+"""
+Headless batch report generation for the Task 5 sales analysis
+
+Renders every chart of the nightly report without a display:
+- Overall: Total by Category (the notebook chart) and monthly Total
+- Per city: Total by Category and monthly Total
+- Per category: Total by City, Total by Product and monthly Total
+
+The data is loaded and aggregated once (through the rollup cube), then
+the charts are rendered in parallel worker processes with the non-GUI
+"Agg" backend. Each worker keeps one Figure and clears it between charts
+instead of building a new one per chart.
+
+Outputs (in --output):
+- <chart>.png / <chart>.svg
+- summary.csv – per-stage and per-chart timings
+
+Usage:
+    python sales_report.py sales_data.csv --output reports --formats png svg --workers 4
+"""
+
+import argparse
+import csv
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sales_analysis import SALES_FILE
+from sales_cube import SalesCube
+
+# --------------- CONFIG ---------------
+
+OUTPUT_DIR = "reports"
+SUMMARY_FILE = "summary.csv"
+FIGURE_SIZE = (8, 4.5)
+DPI = 100
+
+# Set once per worker process by init_worker()
+_figure = None
+_axes = None
+
+
+# --------------- JOBS ---------------
+
+def slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(text)).strip("_").lower()
+
+
+def chart_job(name, kind, title, series, xlabel):
+    """Describe one chart as plain data so it can be sent to a worker."""
+    return {
+        "name": name,
+        "kind": kind,
+        "title": title,
+        "xlabel": xlabel,
+        "labels": [str(label) for label in series.index],
+        "values": [float(v) for v in series.to_numpy()],
+    }
+
+
+def monthly(cube, **filters):
+    series = cube.query(by=[], grain="month", **filters)["Total_sum"]
+    series.index = [period.strftime("%Y-%m") for period in series.index]
+    return series
+
+
+def build_jobs(cube):
+    """Turn the cube into the list of charts to render."""
+    jobs = [
+        chart_job("overall_by_category", "bar", "Total Sales by Category",
+                  cube.query(by="Category")["Total_sum"], "Category"),
+        chart_job("overall_monthly", "line", "Monthly Total Sales",
+                  monthly(cube), "Month"),
+    ]
+
+    cities = cube.query(by="City").index
+    for city in cities:
+        jobs.append(chart_job(
+            f"city_{slug(city)}_by_category", "bar", f"{city} – Total Sales by Category",
+            cube.query(by="Category", City=city)["Total_sum"], "Category",
+        ))
+        jobs.append(chart_job(
+            f"city_{slug(city)}_monthly", "line", f"{city} – Monthly Total Sales",
+            monthly(cube, City=city), "Month",
+        ))
+
+    categories = cube.query(by="Category").index
+    for category in categories:
+        jobs.append(chart_job(
+            f"category_{slug(category)}_by_city", "bar", f"{category} – Total Sales by City",
+            cube.query(by="City", Category=category)["Total_sum"], "City",
+        ))
+        jobs.append(chart_job(
+            f"category_{slug(category)}_by_product", "bar", f"{category} – Total Sales by Product",
+            cube.query(by="Product", Category=category)["Total_sum"], "Product",
+        ))
+        jobs.append(chart_job(
+            f"category_{slug(category)}_monthly", "line", f"{category} – Monthly Total Sales",
+            monthly(cube, Category=category), "Month",
+        ))
+    return jobs
+
+
+# --------------- RENDERING (worker side) ---------------
+
+def init_worker():
+    """Select the non-GUI backend and create the one reusable Figure."""
+    global _figure, _axes
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    # A bare Figure (not pyplot) is never registered with a GUI manager
+    _figure = Figure(figsize=FIGURE_SIZE, dpi=DPI)
+    _axes = _figure.add_subplot()
+
+
+def render_chart(job, output_dir, formats):
+    """Draw one chart on the shared Figure and save it. Returns timings."""
+    if _figure is None:
+        init_worker()
+
+    start = time.perf_counter()
+    _axes.clear()
+    positions = range(len(job["labels"]))
+    if job["kind"] == "bar":
+        _axes.bar(positions, job["values"])
+    else:
+        _axes.plot(positions, job["values"], marker="o")
+    _axes.set_xticks(list(positions))
+    _axes.set_xticklabels(job["labels"], rotation=30, ha="right")
+    _axes.set_title(job["title"])
+    _axes.set_xlabel(job["xlabel"])
+    _axes.set_ylabel("Total Sales")
+    _figure.tight_layout()
+    render_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    files = []
+    for fmt in formats:
+        path = os.path.join(output_dir, f"{job['name']}.{fmt}")
+        _figure.savefig(path, format=fmt)
+        files.append(path)
+    save_seconds = time.perf_counter() - start
+
+    return {
+        "name": job["name"],
+        "render_seconds": render_seconds,
+        "save_seconds": save_seconds,
+        "files": files,
+        "pid": os.getpid(),
+    }
+
+
+def _render_job(args):
+    return render_chart(*args)
+
+
+# --------------- REPORT ---------------
+
+def generate_report(csv_path=SALES_FILE, output_dir=OUTPUT_DIR, formats=("png",), workers=None):
+    """Load, aggregate and render every chart. Returns the summary rows."""
+    os.makedirs(output_dir, exist_ok=True)
+    stages = []
+
+    start = time.perf_counter()
+    cube = SalesCube.from_csv(csv_path)
+    stages.append(("load_and_aggregate", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    jobs = build_jobs(cube)
+    stages.append(("plan_charts", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    tasks = [(job, output_dir, tuple(formats)) for job in jobs]
+    if workers == 1:
+        results = [_render_job(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 4))
+            results = list(pool.map(_render_job, tasks, chunksize=chunksize))
+    stages.append(("render_charts", time.perf_counter() - start))
+
+    rows = [
+        {"stage": name, "chart": "", "seconds": round(seconds, 4), "files": ""}
+        for name, seconds in stages
+    ]
+    for r in results:
+        rows.append({
+            "stage": "render", "chart": r["name"],
+            "seconds": round(r["render_seconds"], 4), "files": "",
+        })
+        rows.append({
+            "stage": "save", "chart": r["name"],
+            "seconds": round(r["save_seconds"], 4), "files": ";".join(r["files"]),
+        })
+    rows.append({
+        "stage": "total", "chart": "",
+        "seconds": round(sum(seconds for _, seconds in stages), 4), "files": "",
+    })
+
+    with open(os.path.join(output_dir, SUMMARY_FILE), "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["stage", "chart", "seconds", "files"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return stages, results
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Render all sales charts headlessly, in parallel, with a timing summary."
+    )
+    parser.add_argument("path", nargs="?", default=SALES_FILE, help="Sales CSV file")
+    parser.add_argument("-o", "--output", default=OUTPUT_DIR, help="Output folder")
+    parser.add_argument(
+        "-f", "--formats", nargs="+", default=["png"], choices=["png", "svg"],
+        help="Image formats to write",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Worker processes (default: CPU count, 1 = no pool)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    stages, results = generate_report(args.path, args.output, args.formats, args.workers)
+
+    print("-" * 50)
+    for name, seconds in stages:
+        print(f"{name:20} {seconds:8.3f} s")
+    print("-" * 50)
+    print(f"[DONE] {len(results)} charts written to {args.output}/ "
+          f"(summary: {os.path.join(args.output, SUMMARY_FILE)})")
+
+
+if __name__ == "__main__":
+    main()
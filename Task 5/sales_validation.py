@@ -0,0 +1,232 @@
+# sales_validation.py
+"""
+Vectorized validation stage for the sales loader
+
+Every chunk of the CSV is checked with whole-column (pandas/numpy)
+operations, never row by row:
+
+- OrderID, Quantity, Price, Total must be numbers (OrderID/Quantity whole,
+  Quantity > 0, Price >= 0)
+- Date must be a real YYYY-MM-DD date
+- Product, Category and City must not be empty
+- Total must equal Quantity x Price
+- OrderID must not repeat (within the chunk or in any earlier chunk)
+
+Good rows come out with the same compact dtypes as sales_analysis.
+Bad rows are appended to a quarantine CSV with an "errors" column,
+e.g. "bad_total;duplicate_order_id".
+
+Usage:
+    from sales_validation import read_valid_sales_chunks
+    for chunk in read_valid_sales_chunks("sales_data.csv", quarantine_path="bad_rows.csv"):
+        ...
+
+CLI:
+    python sales_validation.py sales_data.csv --quarantine bad_rows.csv
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from sales_analysis import DEFAULT_CHUNKSIZE, SALES_DTYPES, SALES_FILE
+
+# --------------- CONFIG ---------------
+
+SALES_COLUMNS = ["OrderID", "Date", "Product", "Category", "Quantity", "Price", "Total", "City"]
+TEXT_COLUMNS = ["Product", "Category", "City"]
+TOTAL_TOLERANCE = 0.01  # allowed |Total - Quantity * Price|
+QUARANTINE_FILE = "bad_rows.csv"
+
+
+# --------------- VALIDATION ---------------
+
+class OrderIdTracker:
+    """
+    Remembers every OrderID seen so far as a few sorted numpy arrays
+    ("runs"), each longer than the next one.
+
+    A new chunk becomes a small run; equal-sized runs are merged, like
+    carrying in binary addition. Each id is merged O(log n) times in
+    total, so tracking n ids costs O(n log n) however many chunks
+    there are, instead of re-sorting everything seen for every chunk.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def seen_before(self, ids):
+        # Sorted lookups walk each run front to back (cache friendly)
+        order = np.argsort(ids, kind="stable")
+        wanted = ids[order]
+        found = np.zeros(len(ids), dtype=bool)
+        for run in self.runs:
+            if not len(run):
+                continue
+            pos = np.searchsorted(run, wanted).clip(max=len(run) - 1)
+            found |= run[pos] == wanted
+        seen = np.empty(len(ids), dtype=bool)
+        seen[order] = found
+        return seen
+
+    def add(self, ids):
+        run = np.unique(ids)
+        if not len(run):
+            return
+        while self.runs and len(self.runs[-1]) <= len(run):
+            # A stable sort is a timsort: on two sorted runs it is a
+            # linear merge
+            merged = np.sort(np.concatenate([self.runs.pop(), run]), kind="stable")
+            keep = np.ones(len(merged), dtype=bool)
+            keep[1:] = merged[1:] != merged[:-1]
+            run = merged[keep]
+        self.runs.append(run)
+
+
+def to_number(column):
+    """Columns the CSV parser already read as numbers are used as-is."""
+    if pd.api.types.is_numeric_dtype(column):
+        return column.astype("float64")
+    return pd.to_numeric(column, errors="coerce")
+
+
+def validate_chunk(raw, tracker=None):
+    """
+    Validate one chunk of raw rows. Numeric columns may already be parsed
+    (the fast path) or still be text when the chunk contains bad values.
+
+    Returns (clean, rejected): clean has compact dtypes, rejected has the
+    original text plus an "errors" column listing every failed check.
+    """
+    order_id = to_number(raw["OrderID"])
+    quantity = to_number(raw["Quantity"])
+    price = to_number(raw["Price"])
+    total = to_number(raw["Total"])
+    date = pd.to_datetime(raw["Date"], format="%Y-%m-%d", errors="coerce")
+
+    ids = order_id.to_numpy(dtype="float64")
+    # Only whole-number ids can be real orders; 1001.5 is a bad_order_id,
+    # not a claim on 1001
+    with np.errstate(invalid="ignore"):
+        valid_ids = (ids % 1 == 0) & (np.abs(ids) < 2**63)
+    duplicate = order_id.duplicated().to_numpy() & valid_ids
+    if tracker is not None:
+        int_ids = ids[valid_ids].astype("int64")
+        duplicate[valid_ids] |= tracker.seen_before(int_ids)
+        tracker.add(int_ids)
+
+    checks = {
+        "bad_order_id": (order_id.isna() | (order_id % 1 != 0)).to_numpy(),
+        "bad_date": date.isna().to_numpy(),
+        "missing_text": raw[TEXT_COLUMNS].isna().any(axis=1).to_numpy()
+        | raw[TEXT_COLUMNS].apply(lambda col: col.str.strip() == "").any(axis=1).to_numpy(),
+        "bad_quantity": (quantity.isna() | (quantity <= 0) | (quantity % 1 != 0)).to_numpy(),
+        "bad_price": (price.isna() | (price < 0)).to_numpy(),
+        "bad_total": (total.isna() | ((total - quantity * price).abs() > TOTAL_TOLERANCE)).to_numpy(),
+        "duplicate_order_id": duplicate,
+    }
+
+    bad = np.zeros(len(raw), dtype=bool)
+    for mask in checks.values():
+        bad |= mask
+
+    # Only the (few) bad rows get their error text built
+    rejected = raw[bad].copy()
+    reasons = np.full(int(bad.sum()), "", dtype=object)
+    for name, mask in checks.items():
+        hit = mask[bad]
+        reasons[hit] = reasons[hit] + name + ";"
+    rejected["errors"] = [r.rstrip(";") for r in reasons]
+
+    good = ~bad
+    clean = pd.DataFrame({
+        "OrderID": order_id[good],
+        "Date": date[good],
+        "Product": raw["Product"][good],
+        "Category": raw["Category"][good],
+        "Quantity": quantity[good],
+        "Price": price[good],
+        "Total": total[good],
+        "City": raw["City"][good],
+    }).astype(SALES_DTYPES)
+    return clean, rejected
+
+
+def read_valid_sales_chunks(path=SALES_FILE, chunksize=DEFAULT_CHUNKSIZE,
+                            quarantine_path=QUARANTINE_FILE, stats=None):
+    """
+    Yield validated chunks of the sales CSV.
+
+    Rejected rows are appended to quarantine_path (None = drop them).
+    Pass a dict as stats to get rows/rejected/seconds counters filled in.
+    """
+    if stats is None:
+        stats = {}
+    stats.update({"rows": 0, "rejected": 0, "validate_seconds": 0.0})
+    if quarantine_path and os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
+
+    tracker = OrderIdTracker()
+    # Text columns stay text; the C parser tries numbers for the rest and
+    # only falls back to strings in chunks that contain bad values
+    text = {col: str for col in TEXT_COLUMNS + ["Date"]}
+    reader = pd.read_csv(
+        path, dtype=text, keep_default_na=False, na_values=[""], chunksize=chunksize
+    )
+    for raw in reader:
+        start = time.perf_counter()
+        clean, rejected = validate_chunk(raw[SALES_COLUMNS], tracker)
+        stats["validate_seconds"] += time.perf_counter() - start
+        stats["rows"] += len(raw)
+        stats["rejected"] += len(rejected)
+
+        if quarantine_path and len(rejected):
+            write_header = not os.path.exists(quarantine_path)
+            rejected.to_csv(quarantine_path, mode="a", header=write_header, index=False)
+        yield clean
+
+
+def load_valid_sales(path=SALES_FILE, quarantine_path=QUARANTINE_FILE):
+    """Load and validate the whole file (only for data that fits in memory)."""
+    chunks = list(read_valid_sales_chunks(path, quarantine_path=quarantine_path))
+    df = pd.concat(chunks, ignore_index=True)
+    # Chunks may have different category sets
+    return df.astype(SALES_DTYPES)
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Validate a sales CSV and quarantine bad rows."
+    )
+    parser.add_argument("path", nargs="?", default=SALES_FILE, help="Sales CSV file")
+    parser.add_argument("--quarantine", default=QUARANTINE_FILE, help="Where to write bad rows")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    stats = {}
+    start = time.perf_counter()
+    for _ in read_valid_sales_chunks(args.path, args.chunksize, args.quarantine, stats):
+        pass
+    elapsed = time.perf_counter() - start
+
+    print(f"Rows checked : {stats['rows']:,}")
+    print(f"Rows rejected: {stats['rejected']:,}" +
+          (f" (see {args.quarantine})" if stats["rejected"] else ""))
+    if elapsed:
+        print(f"Throughput   : {stats['rows'] / elapsed:,.0f} rows/sec overall, "
+              f"{stats['rows'] / max(stats['validate_seconds'], 1e-9):,.0f} rows/sec validation only")
+
+
+if __name__ == "__main__":
+    main()
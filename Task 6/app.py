@@ -1,44 +1,191 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash, make_response, session, abort, jsonify
+import atexit
+import click
+import hashlib
+import hmac
+import json
+import math
 import os
+import shutil
+import signal
+import threading
+import time
 from datetime import datetime
 
+from assets import build_assets, write_assets
+from contacts import ContactIndex, ContactWriter, SqliteStore, import_text_contacts, open_store
+from ratelimit import DuplicateFilter, RateLimiter
+
 app = Flask(__name__)
 
 # Needed for flash messages (like success after contact form submit)
 app.secret_key = "supersecretkey_change_this"
 
+# Projects & skills shown on the home page
+CONTENT_FILE = os.path.join(app.root_path, "content.json")
+
+# Reuse rendered pages until a template or content.json changes
+app.config["PAGE_CACHE"] = True
+# How often (seconds) to look for changed files; 0 = on every request
+app.config["PAGE_CACHE_CHECK_SECONDS"] = 1.0
+
+# Serve CSS/JS minified, fingerprinted and precompressed (see assets.py)
+app.config["ASSET_PIPELINE"] = True
+ASSET_DIR = "dist"  # fingerprinted files are served from /static/dist/
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+# Contact messages are written in the background (see contacts.py) to an
+# indexed SQLite file; a .jsonl file name stores plain JSON Lines instead
+app.config["CONTACT_STORE"] = os.path.join("data", "contacts.db")
+# fsync after every batch ("always"), about once a second ("interval") or never
+app.config["CONTACT_FSYNC"] = "interval"
+
+# /admin/contacts is only available when a token is set
+app.config["ADMIN_TOKEN"] = os.environ.get("ADMIN_TOKEN")
+ADMIN_MAX_PAGE_SIZE = 200
+
+# Throttle the contact form (see ratelimit.py): per client IP a burst of
+# 5 messages, then 1 a minute; per sender email 3, then 1 every 5 minutes
+app.config["CONTACT_RATE_LIMIT"] = True
+ip_limiter = RateLimiter(capacity=5, refill_seconds=60)
+email_limiter = RateLimiter(capacity=3, refill_seconds=300)
+# The same message from the same sender within an hour is only stored once
+duplicate_messages = DuplicateFilter(window=3600)
+
+
+# ---------- Content & Page Cache ----------
+content_cache = {"version": None, "data": None}
+page_cache = {}  # template name -> (site version, html, etag)
+version_check = {"checked": 0.0, "version": None}
+
+
+def site_version():
+    """Modification times of content.json and every template (changes on any edit)."""
+    now = time.monotonic()
+    interval = 0 if app.debug else app.config["PAGE_CACHE_CHECK_SECONDS"]
+    if version_check["version"] is None or now - version_check["checked"] >= interval:
+        template_dir = os.path.join(app.root_path, app.template_folder)
+        paths = [CONTENT_FILE] + sorted(
+            os.path.join(template_dir, name) for name in os.listdir(template_dir)
+        )
+        version_check["version"] = tuple(os.stat(path).st_mtime_ns for path in paths)
+        version_check["checked"] = now
+    return version_check["version"]
+
+
+def load_content():
+    """content.json as a dict, re-read only when the file changed."""
+    version = os.stat(CONTENT_FILE).st_mtime_ns
+    if content_cache["version"] != version:
+        with open(CONTENT_FILE, encoding="utf-8") as f:
+            content_cache["data"] = json.load(f)
+        content_cache["version"] = version
+    return content_cache["data"]
+
+
+def render_page(template):
+    """
+    Render a content page once and serve the same HTML (with an ETag)
+    until a template or the content changes.
+    """
+    # Flash messages are per visitor, so those pages are rendered fresh
+    if not app.config["PAGE_CACHE"] or session.get("_flashes"):
+        return render_template(template, **load_content())
+
+    version = site_version()
+    cached = page_cache.get(template)
+    if cached is None or cached[0] != version:
+        html = render_template(template, **load_content())
+        cached = (version, html, hashlib.md5(html.encode("utf-8")).hexdigest())
+        page_cache[template] = cached
+
+    if cached[2] in request.if_none_match:
+        response = make_response("", 304)
+    else:
+        response = make_response(cached[1])
+    response.set_etag(cached[2])
+    return response
+
+
+# ---------- Static Assets ----------
+assets = {"version": None, "by_source": {}, "by_name": {}}
+
+
+def static_version():
+    folder = app.static_folder
+    return tuple(
+        (name, os.stat(os.path.join(folder, name)).st_mtime_ns)
+        for name in sorted(os.listdir(folder))
+        if os.path.isfile(os.path.join(folder, name))
+    )
+
+
+def refresh_assets():
+    """(Re)build the assets when a file in static/ changed."""
+    version = static_version()
+    if assets["version"] != version:
+        built = build_assets(app.static_folder)
+        assets["by_source"] = built
+        assets["by_name"] = {asset.name: asset for asset in built.values()}
+        assets["version"] = version
+        page_cache.clear()  # cached pages link to the old names
+
+
+refresh_assets()
+
+
+@app.before_request
+def reload_assets_in_debug():
+    if app.debug:
+        refresh_assets()
+
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """url_for('static', filename='style.css') -> /static/dist/style.<hash>.css"""
+    if endpoint != "static" or not app.config["ASSET_PIPELINE"]:
+        return
+    asset = assets["by_source"].get(values.get("filename"))
+    if asset is not None:
+        values["filename"] = f"{ASSET_DIR}/{asset.name}"
+
+
+@app.route(f"/static/{ASSET_DIR}/<path:name>")
+def asset(name):
+    """A fingerprinted asset: cached forever, in the best encoding the client accepts."""
+    found = assets["by_name"].get(name)
+    if found is None:
+        abort(404)
+
+    encoding = found.pick(request.accept_encodings)
+    response = make_response(found.variants[encoding])
+    response.mimetype = found.mimetype
+    if encoding != "identity":
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    response.set_etag(f"{found.etag}-{encoding}")
+    return response.make_conditional(request)
+
 
 # ---------- Home Route ----------
 @app.route("/")
 def home():
-    # You can pass dynamic data here if needed
-    projects = [
-        {
-            "title": "Jarvis AI Assistant",
-            "description": "A voice-controlled desktop assistant that automates tasks like opening apps, searching web, and chatting.",
-            "tech": "Python, SpeechRecognition, SQLite, HuggingFace"
-        },
-        {
-            "title": "Crack Detection using Deep Learning",
-            "description": "A MobileNet-based model to detect structural cracks in images using transfer learning.",
-            "tech": "Python, TensorFlow, OpenCV"
-        },
-        {
-            "title": "Grocery Store Management System",
-            "description": "CRUD-based web app to manage grocery inventory, billing, and reports.",
-            "tech": "Python, Flask, MySQL"
-        }
-    ]
-    skills = [
-        "Python", "Flask", "HTML", "CSS", "JavaScript",
-        "SQL", "Machine Learning", "Data Analysis"
-    ]
-    return render_template("index.html", projects=projects, skills=skills)
+    return render_page("index.html")
 
 
 # ---------- Contact Form Handler ----------
 @app.route("/contact", methods=["POST"])
 def contact():
+    limited = app.config["CONTACT_RATE_LIMIT"]
+    # Checked first, so floods are turned away before any other work
+    if limited:
+        wait = ip_limiter.acquire(request.remote_addr or "")
+        if wait:
+            return too_many_requests(wait)
+
     name = request.form.get("name")
     email = request.form.get("email")
     message = request.form.get("message")
@@ -47,29 +194,158 @@ def contact():
         flash("All fields are required. Please fill the form completely.", "error")
         return redirect(url_for("home"))
 
+    if limited:
+        wait = email_limiter.acquire(email.strip().lower())
+        if wait:
+            return too_many_requests(wait)
+        if duplicate_messages.seen(email, message):
+            # Already have it: say thanks again, but don't store it twice
+            flash("Thank you! Your message has been received.", "success")
+            return redirect(url_for("home"))
+
     # Option 1: Just log to console (for learning)
     print("New contact message:")
     print("Name:", name)
     print("Email:", email)
     print("Message:", message)
 
-    # Option 2: Save to a simple text file (so you can show in internship)
-    save_contact(name, email, message)
+    # Option 2: Save it (queued; written to disk by a background thread)
+    if not save_contact(name, email, message):
+        if limited:
+            # Not stored, so a retry must not count as a duplicate
+            duplicate_messages.forget(email, message)
+        flash("Sorry, we are receiving too many messages right now. Please try again in a minute.", "error")
+        return redirect(url_for("home"))
 
     flash("Thank you! Your message has been received.", "success")
     return redirect(url_for("home"))
 
 
+def too_many_requests(wait):
+    """Plain 429 (no template, no session) with a Retry-After hint."""
+    response = make_response("Too many messages - please try again later.\n", 429)
+    response.headers["Retry-After"] = str(math.ceil(wait))
+    response.mimetype = "text/plain"
+    return response
+
+
+contact_writer = None
+contact_writer_lock = threading.Lock()
+
+def get_contact_writer():
+    """Start the background writer on first use (after app.config is final)."""
+    global contact_writer
+    if contact_writer is not None:
+        return contact_writer
+    with contact_writer_lock:
+        if contact_writer is None:
+            store = open_store(app.config["CONTACT_STORE"], app.config["CONTACT_FSYNC"])
+            contact_writer = ContactWriter(store)
+    return contact_writer
+
+
+def close_contact_writer():
+    """Write whatever is still queued, then stop the writer and close its store."""
+    global contact_writer
+    with contact_writer_lock:
+        writer, contact_writer = contact_writer, None
+    if writer is not None:
+        writer.close()
+
+
+def exit_on_sigterm(signum, frame):
+    # A normal exit runs atexit (and so close_contact_writer); being
+    # killed by the default SIGTERM action would drop the queued messages
+    raise SystemExit(128 + signum)
+
+
+# Write whatever is still queued when the server stops. Servers that
+# handle SIGTERM themselves (gunicorn, ...) already exit normally on it;
+# only SIGKILL or a crash can still lose queued messages.
+atexit.register(close_contact_writer)
+if (threading.current_thread() is threading.main_thread()
+        and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL):
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
+
+
 def save_contact(name, email, message):
-    """Save contact form submissions to a file."""
-    os.makedirs("data", exist_ok=True)
-    filepath = os.path.join("data", "contacts.txt")
-    with open(filepath, "a", encoding="utf-8") as f:
-        f.write(f"Time: {datetime.now()}\n")
-        f.write(f"Name: {name}\n")
-        f.write(f"Email: {email}\n")
-        f.write(f"Message: {message}\n")
-        f.write("-" * 40 + "\n")
+    """Queue a contact form submission. Returns False if the queue is full."""
+    record = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "name": name,
+        "email": email,
+        "message": message,
+    }
+    return get_contact_writer().submit(record)
+
+
+# ---------- Admin: Contact Search ----------
+contact_index = None
+
+@app.route("/admin/contacts")
+def admin_contacts():
+    """
+    Search contact messages (JSON), newest first:
+    /admin/contacts?email=...&q=words&since=2024-01-01&until=2024-02-01&limit=50&after=<cursor>
+    Send the token as "Authorization: Bearer <ADMIN_TOKEN>".
+    """
+    global contact_index
+    token = app.config["ADMIN_TOKEN"]
+    if not token:
+        abort(404)
+    given = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(given.encode(), token.encode()):
+        abort(401)
+
+    writer = get_contact_writer()  # creates the database on first use
+    if not isinstance(writer.store, SqliteStore):
+        abort(501, "Searching needs an SQLite contact store (a .db CONTACT_STORE)")
+    if contact_index is None:
+        contact_index = ContactIndex(writer.store.path)
+
+    args = request.args
+    try:
+        limit = min(max(int(args.get("limit", 50)), 1), ADMIN_MAX_PAGE_SIZE)
+        contacts, cursor = contact_index.search(
+            email=args.get("email"), text=args.get("q"),
+            since=args.get("since"), until=args.get("until"),
+            after=args.get("after"), limit=limit,
+        )
+    except ValueError:
+        abort(400)
+
+    next_url = None
+    if cursor:
+        next_url = url_for("admin_contacts", **{**args.to_dict(), "after": cursor})
+    return jsonify(contacts=contacts, next=cursor, next_url=next_url)
+
+
+@app.cli.command("import-contacts")
+@click.argument("path", default=os.path.join("data", "contacts.txt"))
+def import_contacts(path):
+    """Copy an old contacts.txt file into the contact store."""
+    store = open_store(app.config["CONTACT_STORE"], app.config["CONTACT_FSYNC"])
+    try:
+        imported, skipped = import_text_contacts(path, store)
+    finally:
+        store.close()
+    click.echo(f"Imported {imported} messages into {app.config['CONTACT_STORE']} ({skipped} incomplete skipped)")
+
+
+# ---------- Static Export ----------
+@app.cli.command("freeze")
+@click.option("--output", default="build", show_default=True, help="Folder for the static site")
+def freeze(output):
+    """Pre-render the site to plain HTML + static files."""
+    os.makedirs(output, exist_ok=True)
+    with app.test_request_context("/"):
+        html = render_template("index.html", **load_content())
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(html)
+    shutil.copytree(app.static_folder, os.path.join(output, "static"), dirs_exist_ok=True)
+    if app.config["ASSET_PIPELINE"]:
+        write_assets(assets["by_source"], os.path.join(output, "static", ASSET_DIR))
+    click.echo(f"Site frozen to {output}/ (serve it with any static web server)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+Static asset pipeline for the portfolio site
+
+At startup every CSS/JS file in static/ is:
+- minified (comments and extra whitespace removed)
+- fingerprinted: style.css -> style.3f9c2a61d0.css (hash of the content)
+- precompressed to gzip (and brotli, if the `brotli` package is installed)
+
+Because the file name changes whenever the content changes, browsers may
+cache these files forever ("Cache-Control: immutable"), and a new deploy is
+picked up automatically through the new name.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+ASSET_EXTENSIONS = (".css", ".js")
+HASH_LENGTH = 10
+
+# Quoted strings are copied as-is; everything else gets minified
+CSS_TOKENS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|([^"']+)""", re.S)
+
+
+def minify_css(text):
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    parts = []
+    for quoted, code in CSS_TOKENS.findall(text):
+        if quoted:
+            parts.append(quoted)
+            continue
+        code = re.sub(r"\s+", " ", code)
+        code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+        code = re.sub(r":\s+", ":", code)
+        code = code.replace(";}", "}")
+        parts.append(code)
+    return "".join(parts).strip()
+
+
+def minify_js(text):
+    # Only safe, line-based trimming (no renaming or comment parsing)
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def fingerprint(filename, data):
+    """style.css + content -> style.<hash>.css"""
+    stem, ext = os.path.splitext(filename)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+def compress(data):
+    """Precompressed variants of data, keyed by Content-Encoding."""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    # Only keep variants that are actually smaller
+    return {enc: body for enc, body in variants.items() if len(body) < len(data)}
+
+
+class Asset:
+    """One built file: its fingerprinted name and every encoding of its bytes."""
+
+    def __init__(self, source, name, data):
+        self.source = source
+        self.name = name
+        self.mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.variants = {"identity": data, **compress(data)}
+        self.etag = name.rsplit(".", 2)[-2]
+
+    def pick(self, accept_encodings):
+        """Best encoding the client accepts (brotli, then gzip, then none)."""
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and accept_encodings[encoding]:
+                return encoding
+        return "identity"
+
+
+def build_assets(static_dir):
+    """Build every asset in static_dir. Returns {source name: Asset}."""
+    assets = {}
+    for root, _, files in os.walk(static_dir):
+        for filename in sorted(files):
+            ext = os.path.splitext(filename)[1]
+            if ext not in ASSET_EXTENSIONS:
+                continue
+            path = os.path.join(root, filename)
+            source = os.path.relpath(path, static_dir).replace(os.sep, "/")
+            with open(path, encoding="utf-8") as f:
+                data = MINIFIERS[ext](f.read()).encode("utf-8")
+            name = fingerprint(source, data)
+            assets[source] = Asset(source, name, data)
+    return assets
+
+
+def write_assets(assets, out_dir):
+    """Write the fingerprinted files plus .gz/.br next to them (for static servers)."""
+    suffixes = {"identity": "", "gzip": ".gz", "br": ".br"}
+    for asset in assets.values():
+        path = os.path.join(out_dir, asset.name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        for encoding, data in asset.variants.items():
+            with open(path + suffixes[encoding], "wb") as f:
+                f.write(data)
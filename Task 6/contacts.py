@@ -0,0 +1,340 @@
+"""
+Contact message storage for the portfolio site
+
+The /contact request only puts the message on a queue and returns. A
+background thread takes messages off the queue in batches and appends
+them to an append-only store, so disk latency never sits on the request
+path and concurrent submissions can't interleave lines.
+
+Stores:
+- SqliteStore: one row per message (data/contacts.db), indexed by email
+  and time, with full-text search on the message (ContactIndex)
+- JsonlStore:  one JSON object per line (data/contacts.jsonl)
+
+fsync policy (how hard we try to survive a power cut):
+- "always":   fsync after every batch (safest, slowest)
+- "interval": fsync at most every FSYNC_INTERVAL seconds (default)
+- "never":    leave it to the operating system
+
+Everything still queued is written when the app shuts down (close()).
+Old data/contacts.txt files can be moved over with import_text_contacts().
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+FSYNC_POLICIES = ("always", "interval", "never")
+FSYNC_INTERVAL = 1.0     # seconds, for the "interval" policy
+QUEUE_SIZE = 10_000      # messages waiting to be written
+BATCH_SIZE = 256         # messages per write
+CONTACT_FIELDS = ("time", "name", "email", "message")
+PAGE_SIZE = 50           # contacts per search page
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    time TEXT NOT NULL, name TEXT NOT NULL, email TEXT NOT NULL, message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contacts_email ON contacts (email COLLATE NOCASE, time);
+CREATE INDEX IF NOT EXISTS contacts_time ON contacts (time);
+"""
+
+# Full-text index over contacts.message. SqliteStore.write() adds each
+# batch to it; 'rebuild' indexes rows stored before the index existed.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE contacts_fts USING fts5(message, content='contacts', content_rowid='id');
+INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild');
+"""
+
+
+def check_policy(fsync):
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+
+
+# ---------- Stores ----------
+
+class JsonlStore:
+    """Append-only JSON Lines file."""
+
+    def __init__(self, path, fsync="interval"):
+        check_policy(fsync)
+        self.path = path
+        self.fsync = fsync
+        self.last_sync = time.monotonic()
+        self.dirty = False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write(self, records):
+        self.file.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+        self.file.flush()
+        self.dirty = True
+        if self.fsync == "always":
+            self.sync()
+
+    def sync(self):
+        if self.dirty:
+            os.fsync(self.file.fileno())
+            self.dirty = False
+        self.last_sync = time.monotonic()
+
+    def tick(self):
+        """Called regularly by the writer thread, also when idle."""
+        if self.fsync == "interval" and self.dirty and time.monotonic() - self.last_sync >= FSYNC_INTERVAL:
+            self.sync()
+
+    def close(self):
+        if self.fsync != "never":
+            self.sync()
+        self.file.close()
+
+
+class SqliteStore:
+    """SQLite table in WAL mode, one transaction per batch (see SCHEMA)."""
+
+    SYNCHRONOUS = {"always": "FULL", "interval": "NORMAL", "never": "OFF"}
+
+    def __init__(self, path, fsync="interval"):
+        check_policy(fsync)
+        self.path = path
+        self.fsync = fsync
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Only the writer thread uses this connection after start-up
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # NORMAL in WAL mode syncs at checkpoints, not on every commit
+        self.db.execute(f"PRAGMA synchronous={self.SYNCHRONOUS[fsync]}")
+        self.db.executescript(SCHEMA)
+        if not self.db.execute("SELECT 1 FROM sqlite_master WHERE name = 'contacts_fts'").fetchone():
+            self.db.executescript(FTS_SCHEMA)
+
+    def write(self, records):
+        with self.db:
+            # IMMEDIATE: no other connection can insert between max(id) and our rows
+            self.db.execute("BEGIN IMMEDIATE")
+            last_id = self.db.execute("SELECT coalesce(max(id), 0) FROM contacts").fetchone()[0]
+            self.db.executemany(
+                "INSERT INTO contacts (time, name, email, message) VALUES (?, ?, ?, ?)",
+                [tuple(r[f] for f in CONTACT_FIELDS) for r in records],
+            )
+            # One set-based insert per batch is ~3x faster than a per-row trigger
+            self.db.execute(
+                "INSERT INTO contacts_fts (rowid, message) SELECT id, message FROM contacts WHERE id > ?",
+                (last_id,),
+            )
+
+    def tick(self):
+        pass
+
+    def close(self):
+        self.db.close()
+
+
+class ContactIndex:
+    """Read-only queries on a SqliteStore file (one connection per thread)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    def connection(self):
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path)
+            db.execute("PRAGMA query_only = ON")
+            db.row_factory = sqlite3.Row
+            self.local.db = db
+        return db
+
+    def search(self, email=None, text=None, since=None, until=None, after=None, limit=PAGE_SIZE):
+        """
+        Newest contacts first, filtered by sender email, words in the message
+        and/or a time range (ISO strings, `until` is exclusive).
+
+        Pages are keyset-based: pass the returned cursor as `after` to get the
+        next page (no OFFSET, so deep pages are as fast as the first one).
+        Returns (list of dicts, next cursor or None).
+        """
+        where, params = [], []
+        if email:
+            where.append("email = ? COLLATE NOCASE")
+            params.append(email)
+        query = fts_query(text or "")
+        if query:
+            # Blank text (e.g. q=%20) is no filter; MATCH '' is a syntax error
+            where.append("id IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)")
+            params.append(query)
+        if since:
+            where.append("time >= ?")
+            params.append(since)
+        if until:
+            where.append("time < ?")
+            params.append(until)
+        if after:
+            time_, _, id_ = after.rpartition(",")
+            where.append("(time, id) < (?, ?)")
+            params += [time_, int(id_)]
+
+        sql = "SELECT id, time, name, email, message FROM contacts"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY time DESC, id DESC LIMIT ?"
+        rows = self.connection().execute(sql, params + [limit + 1]).fetchall()
+
+        page = [dict(row) for row in rows[:limit]]
+        cursor = f"{page[-1]['time']},{page[-1]['id']}" if len(rows) > limit else None
+        return page, cursor
+
+
+def fts_query(text):
+    """Search words as FTS5 phrases (all must match), so user input can't break the syntax."""
+    words = text.split()
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+
+def open_store(path, fsync="interval"):
+    """SqliteStore for .db / .sqlite files, JsonlStore otherwise."""
+    if os.path.splitext(path)[1] in (".db", ".sqlite"):
+        return SqliteStore(path, fsync)
+    return JsonlStore(path, fsync)
+
+
+# ---------- Importing contacts.txt ----------
+
+TEXT_SEPARATOR = "-" * 40
+
+
+def parse_text_contacts(lines):
+    """
+    Yield one dict per block of the old contacts.txt format:
+
+        Time: 2024-05-01 10:00:00.123456
+        Name: ...
+        Email: ...
+        Message: ...        (may continue over several lines)
+        ----------------------------------------
+
+    Works line by line, so the file is never loaded as a whole.
+    """
+    record, field = {}, None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line == TEXT_SEPARATOR:
+            if record:
+                yield normalize_text_record(record)
+            record, field = {}, None
+        elif field == "message":
+            record["message"] += "\n" + line
+        else:
+            key, colon, value = line.partition(":")
+            if colon and key.lower() in CONTACT_FIELDS:
+                field = key.lower()
+                record[field] = value[1:] if value.startswith(" ") else value
+    if record:
+        yield normalize_text_record(record)
+
+
+def normalize_text_record(record):
+    try:
+        record["time"] = datetime.fromisoformat(record["time"]).isoformat(timespec="seconds")
+    except (KeyError, ValueError):
+        pass
+    return record
+
+
+def import_text_contacts(path, store, batch_size=BATCH_SIZE):
+    """Copy a contacts.txt file into a store. Returns (imported, skipped)."""
+    imported = skipped = 0
+    batch = []
+    with open(path, encoding="utf-8") as f:
+        for record in parse_text_contacts(f):
+            if not all(record.get(field) for field in CONTACT_FIELDS):
+                skipped += 1
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                store.write(batch)
+                imported += len(batch)
+                batch = []
+    if batch:
+        store.write(batch)
+        imported += len(batch)
+    return imported, skipped
+
+
+# ---------- Background Writer ----------
+
+class ContactWriter:
+    """Moves queued messages to a store in batches, on its own thread."""
+
+    def __init__(self, store, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE):
+        self.store = store
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stats = {"written": 0, "batches": 0, "rejected": 0, "errors": 0}
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="contact-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, record):
+        """Queue a message. Returns False (instead of waiting) when the queue is full."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.stats["rejected"] += 1
+            return False
+
+    def flush(self):
+        """Block until everything queued so far is written."""
+        self.queue.join()
+
+    def close(self):
+        """Write what is still queued, then stop the thread and close the store."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        self.store.close()
+
+    def _run(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=FSYNC_INTERVAL / 2)
+            except queue.Empty:
+                self.store.tick()
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            records = [r for r in batch if r is not None]
+            try:
+                if records:
+                    self.store.write(records)
+                    self.stats["written"] += len(records)
+                    self.stats["batches"] += 1
+                self.store.tick()
+            except Exception as e:
+                # Keep the thread alive; the batch is lost but later ones may succeed
+                self.stats["errors"] += 1
+                print(f"[contact-writer] could not save {len(records)} message(s): {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                return
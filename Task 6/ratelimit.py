@@ -0,0 +1,93 @@
+"""
+Rate limiting & spam throttling for the contact form
+
+- RateLimiter: a token bucket per key (client IP, sender email). Each key
+  may send a burst of `capacity` messages, then one more every
+  `refill_seconds`.
+- DuplicateFilter: remembers recently seen messages, so the same text
+  from the same sender is only stored once.
+
+Both live in memory and hold at most `max_keys` entries; when full, the
+least recently used entry is dropped. (Dropping a bucket is like giving
+it back its full burst, so a flood of new keys can't grow memory, it can
+only make the limit a bit more forgiving.)
+
+Checks are a dict lookup under a lock, so rejecting a request costs far
+less than handling it.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+MAX_KEYS = 10_000
+
+
+class RateLimiter:
+    """Token buckets keyed by any string, least recently used evicted first."""
+
+    def __init__(self, capacity, refill_seconds, max_keys=MAX_KEYS):
+        self.capacity = capacity
+        self.rate = 1 / refill_seconds  # tokens per second
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()    # key -> (tokens, last update)
+        self.lock = threading.Lock()
+
+    def acquire(self, key, now=None):
+        """Take one token. Returns 0 if allowed, else the seconds to wait."""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            entry = self.buckets.pop(key, None)
+            if entry is None:
+                tokens = self.capacity
+            else:
+                tokens = min(self.capacity, entry[0] + (now - entry[1]) * self.rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.rate
+
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        return wait
+
+
+class DuplicateFilter:
+    """Spots messages that were already sent within the last `window` seconds."""
+
+    def __init__(self, window, max_keys=MAX_KEYS):
+        self.window = window
+        self.max_keys = max_keys
+        self.seen_at = OrderedDict()  # digest -> time first seen
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def digest(*parts):
+        # Case and whitespace changes don't make a message new
+        text = "\0".join(" ".join(part.lower().split()) for part in parts)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def seen(self, *parts, now=None):
+        """True if these parts were seen recently; otherwise remember them."""
+        now = time.monotonic() if now is None else now
+        key = self.digest(*parts)
+        with self.lock:
+            first = self.seen_at.get(key)
+            if first is not None and now - first < self.window:
+                self.seen_at.move_to_end(key)
+                return True
+            self.seen_at[key] = now
+            self.seen_at.move_to_end(key)
+            if len(self.seen_at) > self.max_keys:
+                self.seen_at.popitem(last=False)
+        return False
+
+    def forget(self, *parts):
+        """Undo seen() for a message that could not be stored after all."""
+        key = self.digest(*parts)
+        with self.lock:
+            self.seen_at.pop(key, None)
@@ -1,15 +1,25 @@
 import os
+import sys
 import argparse
 
-from PIL import Image
+# PIL and tqdm are imported on first use (see resize_image / load_tqdm),
+# so `--help` and argument errors show up without waiting for them
 
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
+# Shared process-pool job runner (../shared/jobrunner.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from jobrunner import Job, JobRunner
 
 VALID_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff")
+JOB_TIMEOUT = 120  # seconds per image before it is given up on
+
+
+def load_tqdm():
+    """The tqdm progress bar class, or None if tqdm isn't installed."""
+    try:
+        from tqdm import tqdm
+        return tqdm
+    except ImportError:
+        return None
 
 
 def list_images(input_folder):
@@ -64,6 +74,34 @@ def get_output_name(index, original_name, fmt_ext, rename_prefix):
         return f"{base_name}_resized.{fmt_ext}"
 
 
+def resize_image(input_path, output_path, width, height, keep_aspect,
+                 auto_orientation, output_format, quality):
+    """Resize/convert one image (runs in a worker process)."""
+    from PIL import Image
+
+    with Image.open(input_path) as img:
+        # For JPEG: convert from RGBA/P to RGB to avoid errors
+        if output_format in ("JPEG", "JPG") and img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+
+        new_size = compute_new_size(
+            img,
+            width,
+            height,
+            keep_aspect=keep_aspect,
+            auto_orientation=auto_orientation,
+        )
+
+        resized = img.resize(new_size, Image.LANCZOS)
+
+        save_kwargs = {}
+        # quality relevant mainly for JPEG/WEBP
+        if output_format in ("JPEG", "JPG", "WEBP"):
+            save_kwargs["quality"] = quality
+
+        resized.save(output_path, output_format, **save_kwargs)
+
+
 def process_images(
     input_folder,
     output_folder,
@@ -74,6 +112,8 @@ def process_images(
     output_format,
     quality,
     rename_prefix,
+    workers=None,
+    timeout=JOB_TIMEOUT,
 ):
     os.makedirs(output_folder, exist_ok=True)
 
@@ -94,63 +134,55 @@ def process_images(
     }
     fmt_ext = ext_map.get(output_format, output_format.lower())
 
+    runner = JobRunner(workers=workers, timeout=timeout, preload=["PIL.Image"])
+
     print(f"[INFO] Found {len(images)} images in '{input_folder}'.")
     print(f"[INFO] Output format: {output_format}, quality: {quality}")
     print(f"[INFO] Keep aspect ratio: {keep_aspect}, auto-orientation: {auto_orientation}")
     print(f"[INFO] Output folder: {output_folder}")
+    print(f"[INFO] Workers: {runner.workers}")
     print("-" * 50)
 
-    iterator = images
-    if TQDM_AVAILABLE:
-        iterator = tqdm(images, desc="Processing images", unit="img")
-
-    processed = 0
-    errors = 0
-
-    for idx, filename in enumerate(iterator, start=1):
-        input_path = os.path.join(input_folder, filename)
-
-        try:
-            with Image.open(input_path) as img:
-                # For JPEG: convert from RGBA/P to RGB to avoid errors
-                if output_format in ("JPEG", "JPG") and img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-
-                new_size = compute_new_size(
-                    img,
-                    width,
-                    height,
-                    keep_aspect=keep_aspect,
-                    auto_orientation=auto_orientation,
-                )
-
-                resized = img.resize(new_size, Image.LANCZOS)
-
-                output_name = get_output_name(
-                    index=idx,
-                    original_name=filename,
-                    fmt_ext=fmt_ext,
-                    rename_prefix=rename_prefix,
-                )
-                output_path = os.path.join(output_folder, output_name)
-
-                save_kwargs = {}
-                # quality relevant mainly for JPEG/WEBP
-                if output_format in ("JPEG", "JPG", "WEBP"):
-                    save_kwargs["quality"] = quality
-
-                resized.save(output_path, output_format, **save_kwargs)
-                processed += 1
-
-        except Exception as e:
-            errors += 1
-            if TQDM_AVAILABLE:
-                tqdm.write(f"[ERROR] Could not process {filename}: {e}")
+    # One job per image; the workers share them across all CPU cores
+    jobs = []
+    for idx, filename in enumerate(images, start=1):
+        output_name = get_output_name(
+            index=idx,
+            original_name=filename,
+            fmt_ext=fmt_ext,
+            rename_prefix=rename_prefix,
+        )
+        jobs.append(Job(filename, resize_image, (
+            os.path.join(input_folder, filename),
+            os.path.join(output_folder, output_name),
+            width,
+            height,
+            keep_aspect,
+            auto_orientation,
+            output_format,
+            quality,
+        )))
+
+    tqdm = load_tqdm()
+    bar = tqdm(total=len(jobs), desc="Processing images", unit="img") if tqdm else None
+
+    def on_done(result):
+        if bar is not None:
+            bar.update()
+        if not result.ok:
+            message = f"[ERROR] Could not process {result.name}: {result.error}"
+            if bar is not None:
+                tqdm.write(message)
             else:
-                print(f"[ERROR] Could not process {filename}: {e}")
+                print(message)
+
+    report = runner.run(jobs, progress=on_done)
+    if bar is not None:
+        bar.close()
 
     print("-" * 50)
-    print(f"[DONE] Processed: {processed}, Errors: {errors}")
+    print(f"[DONE] Processed: {report.succeeded}, Errors: {len(report.failures)}")
+    print(f"[INFO] {report.summary()}")
 
 
 def parse_args():
@@ -191,6 +223,14 @@ def parse_args():
         default=None,
         help="Bulk rename prefix (e.g., 'photo' → photo_001.jpg)",
     )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="Worker processes (default: one per CPU core, 1 = no extra processes)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=JOB_TIMEOUT,
+        help="Seconds allowed per image before it is skipped",
+    )
     return parser.parse_args()
 
 
@@ -207,6 +247,8 @@ def main():
         output_format=args.format,
         quality=args.quality,
         rename_prefix=args.rename_prefix,
+        workers=args.workers,
+        timeout=args.timeout,
     )
 
 
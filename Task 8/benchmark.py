@@ -0,0 +1,239 @@
+# benchmark.py
+"""
+Benchmarks for the chatbot.
+
+intents: generates thousands of synthetic intents (random 1-3 word
+phrases) and times matching a batch of messages with:
+
+- substring: the old if/elif style, `phrase in text` for every phrase
+- per-rule:  one word-boundary regex per phrase, tried in order
+- compiled:  IntentMatcher – one combined regex, one pass per message
+
+calc: latency of the calculator paths on random arithmetic expressions:
+
+- startup: a fresh Python process evaluating one expression
+- sympy:   N(sympify(expr)), the old way
+- fast:    the AST evaluator
+- cached:  calculate_fast() answering a repeated expression
+
+Usage:
+    python benchmark.py intents --intents 100 1000 5000 --messages 2000
+    python benchmark.py calc --expressions 2000
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import string
+import subprocess
+import sys
+import time
+
+from evaluator import CACHE_SIZE, calculate_fast, evaluate, evaluate_sympy, format_number
+from intents import IntentMatcher, normalize
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# --------------- SYNTHETIC DATA ---------------
+
+def make_vocabulary(rng, size):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))))
+    return sorted(words)
+
+
+def make_intents(rng, vocabulary, count, patterns_per_intent=3):
+    intents = []
+    for i in range(count):
+        patterns = [" ".join(rng.sample(vocabulary, rng.randint(1, 3)))
+                    for _ in range(patterns_per_intent)]
+        intents.append({"name": f"intent_{i}", "patterns": patterns, "responses": [f"reply {i}"]})
+    return intents
+
+
+def make_messages(rng, vocabulary, intents, count, hit_rate=0.5):
+    """Random 8-15 word messages; about hit_rate of them contain a known phrase."""
+    messages = []
+    for _ in range(count):
+        words = rng.choices(vocabulary, k=rng.randint(8, 15))
+        if rng.random() < hit_rate:
+            phrase = rng.choice(rng.choice(intents)["patterns"])
+            words.insert(rng.randint(0, len(words)), phrase)
+        messages.append(" ".join(words))
+    return messages
+
+
+# --------------- MATCHERS TO COMPARE ---------------
+
+def substring_matcher(intents):
+    rules = [(intent["name"], intent["patterns"]) for intent in intents]
+
+    def match(text):
+        text = text.lower()
+        for name, patterns in rules:
+            for pattern in patterns:
+                if pattern in text:
+                    return name
+        return None
+    return match
+
+
+def per_rule_matcher(intents):
+    rules = [
+        (intent["name"], [re.compile(r"(?<!\w)" + re.escape(normalize(p)) + r"(?!\w)")
+                          for p in intent["patterns"]])
+        for intent in intents
+    ]
+
+    def match(text):
+        text = text.lower()
+        for name, regexes in rules:
+            for regex in regexes:
+                if regex.search(text):
+                    return name
+        return None
+    return match
+
+
+# --------------- BENCHMARK ---------------
+
+def time_matcher(match, messages, repeat=3):
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [match(m) for m in messages]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def bench_intents(intent_counts, message_count, seed):
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng, 20_000)
+
+    print(f"{'intents':>8} {'compile ms':>11} {'substring µs':>13} {'per-rule µs':>12} "
+          f"{'compiled µs':>12} {'speed-up':>9}")
+    print("-" * 70)
+    for count in intent_counts:
+        intents = make_intents(rng, vocabulary, count)
+        messages = make_messages(rng, vocabulary, intents, message_count)
+
+        start = time.perf_counter()
+        matcher = IntentMatcher(intents)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        substring_s, _ = time_matcher(substring_matcher(intents), messages)
+        per_rule_s, expected = time_matcher(per_rule_matcher(intents), messages)
+        compiled_s, results = time_matcher(matcher.match, messages)
+
+        # The compiled regex must pick the same intent as trying rules in order
+        mismatches = sum(a != b for a, b in zip(expected, results))
+        per_message = 1e6 / message_count
+        print(f"{count:>8,} {compile_ms:>11.1f} {substring_s * per_message:>13.1f} "
+              f"{per_rule_s * per_message:>12.1f} {compiled_s * per_message:>12.1f} "
+              f"{per_rule_s / compiled_s:>8.1f}x"
+              + (f"  [{mismatches} mismatches]" if mismatches else ""))
+
+
+def make_expression(rng, depth=0):
+    """A random expression in the chatbot grammar, e.g. (12.5-3)^2%7."""
+    if depth > 2 or rng.random() < 0.3:
+        return str(rng.randint(1, 999)) if rng.random() < 0.7 else f"{rng.uniform(0, 100):.2f}"
+    left = make_expression(rng, depth + 1)
+    right = make_expression(rng, depth + 1)
+    op = rng.choice("+-*/%")
+    if rng.random() < 0.1:
+        op, right = "^", str(rng.randint(0, 4))
+    expr = f"{left}{op}{right}"
+    return f"({expr})" if rng.random() < 0.3 else expr
+
+
+def latencies(func, items):
+    """Per-call latency in microseconds."""
+    result = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        result.append((time.perf_counter() - start) * 1e6)
+    return result
+
+
+def startup_seconds(code, repeat=3):
+    """Best wall time of a fresh interpreter running code."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def fast_path(expr):
+    try:
+        return format_number(evaluate(expr))
+    except (ArithmeticError, ValueError):
+        return None
+
+
+def bench_calc(expression_count, seed):
+    rng = random.Random(seed)
+    expressions = [make_expression(rng) for _ in range(expression_count)]
+
+    print(f"{'Startup (new process, one answer)':36} {'':>10}")
+    sympy_start = startup_seconds("from sympy import N, sympify; N(sympify('2+3*5'))")
+    fast_start = startup_seconds("from evaluator import calculate; calculate('2+3*5')")
+    print(f"{'  sympy':36} {sympy_start * 1000:>10.1f} ms")
+    print(f"{'  fast path':36} {fast_start * 1000:>10.1f} ms")
+
+    evaluate_sympy("1+1")  # keep the SymPy import out of the timings
+    # Repeats are only cached while they fit in the LRU
+    repeated = expressions[:CACHE_SIZE]
+    calculate_fast.cache_clear()
+    for expr in repeated:
+        calculate_fast(expr)
+    cases = [
+        ("sympy  N(sympify(expr))", latencies(evaluate_sympy, expressions)),
+        ("fast   AST evaluator", latencies(fast_path, expressions)),
+        ("cached calculate_fast() repeat", latencies(calculate_fast, repeated)),
+    ]
+
+    print("-" * 60)
+    print(f"{'Per expression':36} {'p50 µs':>10} {'p95 µs':>10}")
+    for label, times in cases:
+        p95 = statistics.quantiles(times, n=20)[-1]
+        print(f"{'  ' + label:36} {statistics.median(times):>10.1f} {p95:>10.1f}")
+    print("-" * 60)
+    print(f"[DONE] {expression_count:,} expressions, e.g. {expressions[0]}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks for the chatbot.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    intents = sub.add_parser("intents", help="Compiled intent matcher vs. rule-by-rule matching")
+    intents.add_argument("--intents", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                         help="Numbers of intents to test")
+    intents.add_argument("--messages", type=int, default=1000, help="Messages per run")
+    intents.add_argument("--seed", type=int, default=42)
+
+    calc = sub.add_parser("calc", help="Calculator latency: SymPy vs. fast path vs. cache")
+    calc.add_argument("--expressions", type=int, default=2000, help="Random expressions to time")
+    calc.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "intents":
+        bench_intents(args.intents, args.messages, args.seed)
+    elif args.command == "calc":
+        bench_calc(args.expressions, args.seed)
+
+
+if __name__ == "__main__":
+    main()
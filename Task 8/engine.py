@@ -0,0 +1,156 @@
+import re
+import time
+
+from evaluator import LimitExceeded, UnsupportedExpression, calculate_fast
+from intents import INTENTS_FILE, IntentMatcher
+from sandbox import EvaluationPool
+
+# -----------------------------
+# Messages
+# -----------------------------
+WELCOME = [
+    "Hello! I am your simple rule-based chatbot with calculator support.",
+    "Type 'exit' to stop the conversation.",
+    "You can also type math expressions like: 2+3*5, (10/3)^2, 100-45, etc.",
+    "I can also understand sentences like: 'what is 10+5*3' or 'solve 100-45'",
+]
+GOODBYE = "Goodbye! Have a great day 🙂"
+EXIT_COMMAND = "exit"
+
+
+# -----------------------------
+# Extract math expression
+# -----------------------------
+def extract_expression(text: str) -> str:
+    """
+    Extract math expression from any sentence.
+    Example:
+    'what is 10+5*3' -> '10+5*3'
+    """
+    cleaned = re.sub(r"[^0-9+\-*/%^().]", "", text)
+    return cleaned.strip()
+
+
+def is_math_expression(text: str) -> bool:
+    """
+    Determine if the cleaned text is a valid math expression.
+    """
+    expr = extract_expression(text)
+    if not expr:
+        return False
+
+    has_digit = any(ch.isdigit() for ch in expr)
+    has_op = any(ch in "+-*/%^()." for ch in expr)
+
+    return has_digit and has_op
+
+
+# -----------------------------
+# Conversation state
+# -----------------------------
+class Session:
+    """Everything the bot remembers about one conversation."""
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.started = time.time()
+        self.turns = 0
+        self.last_intent = None
+        self.closed = False
+
+
+class ChatEngine:
+    """
+    The chatbot without any input/output: give it a session and a message,
+    get the reply back. One engine is shared by all sessions.
+    """
+
+    def __init__(self, matcher: IntentMatcher = None, pool: EvaluationPool = None):
+        self.matcher = matcher or IntentMatcher.from_file(INTENTS_FILE)
+        self.pool = pool  # started on the first calculation that needs SymPy
+        self.next_id = 1
+
+    def new_session(self) -> Session:
+        session = Session(self.next_id)
+        self.next_id += 1
+        return session
+
+    def get_pool(self) -> EvaluationPool:
+        if self.pool is None:
+            self.pool = EvaluationPool()
+        return self.pool
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+
+    # -----------------------------
+    # Replies
+    # -----------------------------
+    def reply(self, session: Session, user_raw: str) -> str:
+        """
+        Answer one message. After 'exit' the session is marked closed.
+        Calculations only SymPy can do run in the worker pool; this waits
+        for them (at most the pool's time limit).
+        """
+        answer, slow_expr = self.quick_reply(session, user_raw)
+        if slow_expr is None:
+            return answer
+        try:
+            outcome = self.get_pool().calculate(slow_expr)
+        except LimitExceeded as e:
+            outcome = e
+        return self.math_reply(session, user_raw, outcome)
+
+    async def reply_async(self, session: Session, user_raw: str) -> str:
+        """Same as reply(), but awaits slow calculations instead of blocking."""
+        answer, slow_expr = self.quick_reply(session, user_raw)
+        if slow_expr is None:
+            return answer
+        try:
+            outcome = await self.get_pool().calculate_async(slow_expr)
+        except LimitExceeded as e:
+            outcome = e
+        return self.math_reply(session, user_raw, outcome)
+
+    def quick_reply(self, session: Session, user_raw: str):
+        """
+        Answer everything that needs no waiting.
+        Returns (reply, None), or (None, expression) for the worker pool.
+        """
+        session.turns += 1
+        user = user_raw.lower().strip()
+
+        # Exit command
+        if user == EXIT_COMMAND:
+            session.closed = True
+            return GOODBYE, None
+
+        # 1️⃣ Try to evaluate math inside the text
+        if is_math_expression(user_raw):
+            expr = extract_expression(user_raw)
+            try:
+                outcome = calculate_fast(expr)
+            except UnsupportedExpression:
+                return None, expr
+            except LimitExceeded as e:
+                outcome = e
+            return self.math_reply(session, user_raw, outcome), None
+
+        return self.text_reply(session, user), None
+
+    def math_reply(self, session: Session, user_raw: str, outcome) -> str:
+        """outcome is (success, result) or the LimitExceeded that stopped it."""
+        if isinstance(outcome, LimitExceeded):
+            session.last_intent = "math"
+            return f"Sorry, that calculation is too big for me: {outcome} 🤯"
+        success, result = outcome
+        if success:
+            session.last_intent = "math"
+            return f"The result is {result}"
+        return self.text_reply(session, user_raw.lower().strip())
+
+    def text_reply(self, session: Session, user: str) -> str:
+        # 2️⃣ Rule-based responses (or a random default one)
+        session.last_intent = self.matcher.match(user)
+        return self.matcher.response(session.last_intent)
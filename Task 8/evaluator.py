@@ -0,0 +1,203 @@
+# evaluator.py
+"""
+Fast numeric evaluator for the chatbot's calculator
+
+The chatbot only accepts the characters 0-9 . + - * / % ^ ( ), so plain
+arithmetic does not need SymPy. This module:
+
+- parses the expression with Python's own parser (ast) and walks the
+  tree, allowing only numbers, + - * / % ** and unary +/-
+  (^ means power, as in SymPy)
+- never calls eval(), so no names, calls or attributes can sneak in
+- caches results (LRU), so repeated questions are answered instantly
+- imports SymPy lazily, only for expressions the fast path can't do
+  (e.g. roots of negative numbers)
+
+Inputs like 9^9^9^9 would take forever (or all memory), so the fast path
+refuses - before doing the work - expressions that are too long, nested
+too deeply, or would produce a huge whole number (LimitExceeded). The
+SymPy fallback has no such checks; run it through sandbox.EvaluationPool
+to put a time limit on it.
+
+Usage:
+    from evaluator import calculate
+    calculate("(10/3)^2")    # -> (True, "11.1111111111111")
+    calculate("1/0")         # -> (False, None)
+    calculate("9^9^9^9")     # raises LimitExceeded
+"""
+
+import ast
+import math
+import operator
+from decimal import ROUND_HALF_UP, Context, Decimal, localcontext
+from functools import lru_cache
+
+# --------------- CONFIG ---------------
+
+CACHE_SIZE = 1024
+SIGNIFICANT_DIGITS = 15  # same precision SymPy's N() prints
+MIN_FIXED_EXPONENT = -4  # smaller numbers print as 1.23400000000000e-5, like SymPy
+FORMAT_CONTEXT = Context(rounding=ROUND_HALF_UP)  # SymPy rounds ties up when printing
+
+MAX_LENGTH = 200         # characters in an expression
+MAX_NESTING = 20         # levels of brackets
+MAX_EXPONENT = 10_000    # |exponent| of a power
+MAX_INT_BITS = 10_000    # size of a whole-number result (~3000 digits)
+
+BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+class UnsupportedExpression(ValueError):
+    """The fast path can't evaluate this; SymPy may still be able to."""
+
+
+class LimitExceeded(ValueError):
+    """The expression is too big to evaluate; the message says why."""
+
+
+# --------------- LIMITS ---------------
+
+def check_size(expr):
+    """Reject overly long or deeply nested expressions before parsing them."""
+    if len(expr) > MAX_LENGTH:
+        raise LimitExceeded(f"it is longer than {MAX_LENGTH} characters")
+    depth = 0
+    for ch in expr:
+        if ch == "(":
+            depth += 1
+            if depth > MAX_NESTING:
+                raise LimitExceeded(f"it has more than {MAX_NESTING} levels of brackets")
+        elif ch == ")":
+            depth -= 1
+
+
+def checked_pow(base, exponent):
+    if abs(exponent) > MAX_EXPONENT:
+        raise LimitExceeded(f"the exponent is above {MAX_EXPONENT:,}")
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        if base.bit_length() * exponent > MAX_INT_BITS:
+            raise LimitExceeded("the result would be too big")
+    return operator.pow(base, exponent)
+
+
+def checked_mul(left, right):
+    if isinstance(left, int) and isinstance(right, int):
+        if left.bit_length() + right.bit_length() > MAX_INT_BITS:
+            raise LimitExceeded("the result would be too big")
+    return operator.mul(left, right)
+
+
+CHECKED_OPS = {**BINARY_OPS, ast.Pow: checked_pow, ast.Mult: checked_mul}
+
+
+# --------------- FAST PATH ---------------
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in CHECKED_OPS:
+        result = CHECKED_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPS:
+        result = UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    else:
+        raise UnsupportedExpression(f"Unsupported syntax: {type(node).__name__}")
+    # e.g. (-8)^0.5 - later operators (like %) can't take a complex number
+    if isinstance(result, complex):
+        raise UnsupportedExpression("Complex intermediate result")
+    return result
+
+
+def evaluate(expr):
+    """
+    Evaluate an arithmetic expression with plain Python numbers.
+
+    Raises LimitExceeded when the expression is too big, UnsupportedExpression
+    for anything outside the grammar (or a complex result), and
+    ZeroDivisionError / OverflowError for bad arithmetic.
+    """
+    check_size(expr)
+    try:
+        tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise UnsupportedExpression(f"Invalid syntax: {expr}") from e
+    result = _eval_node(tree.body)
+    if isinstance(result, float) and not math.isfinite(result):
+        # e.g. 1e308*10; SymPy's arbitrary-size floats can still answer it
+        raise UnsupportedExpression(f"Float overflow: {expr}")
+    return result
+
+
+def format_number(value):
+    """
+    Text of a result exactly as SymPy's N() prints it: 15 significant
+    digits, trailing zeros kept (17.0000000000000), scientific notation
+    for very large or small numbers (1.26765060022823e+30).
+    """
+    if value == 0:
+        return "0"
+    if isinstance(value, int) and value.bit_length() <= 1000:
+        # SymPy rounds whole numbers to a float before printing them
+        value = float(value)
+    # Decimal: exact for floats, and works for ints too big for a float
+    with localcontext(FORMAT_CONTEXT):
+        mantissa, exponent = format(Decimal(value), f".{SIGNIFICANT_DIGITS - 1}e").split("e")
+    exponent = int(exponent)
+    sign = "-" if mantissa.startswith("-") else ""
+    digits = mantissa.lstrip("-").replace(".", "")
+    if exponent < MIN_FIXED_EXPONENT or exponent >= SIGNIFICANT_DIGITS:
+        return f"{sign}{digits[0]}.{digits[1:]}e{exponent:+d}"
+    if exponent >= 0:
+        return f"{sign}{digits[:exponent + 1]}.{digits[exponent + 1:]}"
+    return f"{sign}0.{'0' * (-exponent - 1)}{digits}"
+
+
+# --------------- SLOW PATH ---------------
+
+def evaluate_sympy(expr):
+    """The old way: symbolic parse + numeric evaluation (imports SymPy on first use)."""
+    from sympy import N, sympify
+    return N(sympify(expr))
+
+
+# --------------- PUBLIC API ---------------
+
+@lru_cache(maxsize=CACHE_SIZE)
+def calculate_fast(expr):
+    """
+    Return (success, result) without SymPy; results are cached.
+    Raises UnsupportedExpression when only SymPy can answer, LimitExceeded
+    when the expression is too big.
+    """
+    try:
+        return True, format_number(evaluate(expr))
+    except ZeroDivisionError:
+        return False, None
+    except OverflowError:
+        raise LimitExceeded("the result would be too big")
+
+
+def calculate_slow(expr):
+    """Return (success, result) using SymPy. No time limit - see sandbox.py."""
+    try:
+        return True, evaluate_sympy(expr)
+    except Exception:
+        return False, None
+
+
+def calculate(expr):
+    """Return (success, result) for a math expression (fast path, then SymPy)."""
+    try:
+        return calculate_fast(expr)
+    except UnsupportedExpression:
+        return calculate_slow(expr)
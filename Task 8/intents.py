@@ -0,0 +1,141 @@
+# intents.py
+"""
+Compiled intent matcher for the rule-based chatbot
+
+Intents (trigger phrases + responses) live in a data file (intents.json)
+instead of an if/elif chain. All phrases are compiled into ONE regex:
+
+- the phrases are merged into a prefix tree, so "how are you" and
+  "how old are you" share "how ", and the regex tries each character
+  once instead of once per phrase
+- every phrase must match whole words: "hi" matches "hi there" but not
+  "this"
+- the input is scanned in a single pass, however many intents there are
+
+If several intents appear in one message, the one listed first in the
+data file wins (the same order the old if/elif chain used).
+
+Usage:
+    from intents import IntentMatcher
+    matcher = IntentMatcher.from_file("intents.json")
+    matcher.match("hi there")        # -> "greeting"
+    matcher.respond("tell me a joke")
+"""
+
+import json
+import os
+import random
+import re
+
+# --------------- CONFIG ---------------
+
+INTENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intents.json")
+WORD_CHAR = re.compile(r"\w")
+
+
+def normalize(text):
+    """Lowercase and collapse runs of whitespace to one space."""
+    return " ".join(text.lower().split())
+
+
+# --------------- REGEX COMPILATION ---------------
+
+def build_trie(phrases):
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = True  # end of a phrase
+    return trie
+
+
+def trie_to_regex(node):
+    """
+    Turn a prefix tree into a regex alternation, e.g. {hi, hey, hello}
+    -> h(?:i|e(?:y|llo)). Longer phrases are tried before their prefixes.
+    """
+    branches = []
+    for ch in sorted(k for k in node if k):
+        # Spaces in a phrase match any run of whitespace in the input
+        head = r"\s+" if ch == " " else re.escape(ch)
+        branches.append(head + trie_to_regex(node[ch]))
+
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A phrase may also end here: make the longer continuations optional
+        body = body + "?" if len(branches) == 1 and len(body) == 1 else "(?:" + body + ")?"
+    return body
+
+
+def compile_phrases(phrases):
+    """
+    One regex for all phrases, matching whole words only.
+
+    The match is a zero-width lookahead, so finditer() reports a phrase at
+    every word start, also when it overlaps a phrase found just before.
+    """
+    if not phrases:
+        return re.compile(r"(?!)")  # never matches
+    return re.compile(r"(?<!\w)(?=(" + trie_to_regex(build_trie(phrases)) + r")(?!\w))")
+
+
+# --------------- MATCHER ---------------
+
+class IntentMatcher:
+    """Maps a message to the first matching intent with one compiled regex."""
+
+    def __init__(self, intents, fallback=None):
+        """
+        intents:  list of {"name", "patterns", "responses"} dicts, in
+                  priority order
+        fallback: responses used when nothing matches
+        """
+        self.intents = intents
+        self.fallback = fallback or []
+        self.responses = {intent["name"]: intent["responses"] for intent in intents}
+
+        # phrase -> (priority, intent name); the first intent to list a phrase keeps it
+        self.phrases = {}
+        for priority, intent in enumerate(intents):
+            for pattern in intent["patterns"]:
+                self.phrases.setdefault(normalize(pattern), (priority, intent["name"]))
+        self.regex = compile_phrases(list(self.phrases))
+
+        # The regex reports the longest phrase at a position; a shorter
+        # phrase that ends on a word boundary inside it matched there too
+        self.best = {}
+        for phrase, hit in self.phrases.items():
+            for i, ch in enumerate(phrase):
+                if WORD_CHAR.match(ch) is None and phrase[:i] in self.phrases:
+                    hit = min(hit, self.phrases[phrase[:i]])
+            self.best[phrase] = hit
+
+    @classmethod
+    def from_file(cls, path=INTENTS_FILE):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["intents"], data.get("fallback"))
+
+    def match(self, text):
+        """Return the name of the best intent in text, or None."""
+        best = None
+        for found in self.regex.finditer(text.lower()):
+            hit = self.best[normalize(found.group(1))]
+            if best is None or hit < best:
+                best = hit
+                if hit[0] == 0:
+                    break  # nothing can beat the first intent
+        return best[1] if best else None
+
+    def response(self, name):
+        """A random response of intent `name` (None = a fallback, if any)."""
+        if name is None:
+            return random.choice(self.fallback) if self.fallback else None
+        return random.choice(self.responses[name])
+
+    def respond(self, text):
+        """A random response of the matched intent (or a fallback / None)."""
+        return self.response(self.match(text))
@@ -0,0 +1,159 @@
+# load_test.py
+"""
+Load test for the chatbot server.
+
+Opens thousands of concurrent TCP conversations, each sending a short
+mix of greetings, questions, calculations and unknown text, and waits for
+every reply. Reports reply latency (p50/p95/p99), messages per second and
+how many sessions were open at the same time.
+
+By default the server runs inside this process, on the same single-
+threaded event loop as the clients, so the numbers are for ONE core doing
+both sides. Use --host/--port to test a server started separately.
+
+Usage:
+    python load_test.py --sessions 2000 --messages 10
+    python load_test.py --sessions 5000 --port 8765 --external
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from engine import WELCOME
+from server import HOST, ChatServer
+
+# --------------- CONFIG ---------------
+
+MESSAGES = [
+    "hi",
+    "what is your name?",
+    "how are you",
+    "tell me a joke",
+    "what is 10+5*3",
+    "(10/3)^2",
+    "999*999-11-+74/3",
+    "who made you",
+    "this is something random",
+    "how is the weather today",
+]
+CONNECT_BATCH = 200  # connections opened per event-loop step
+
+
+def raise_file_limit(wanted):
+    """Each connection needs a file descriptor (two with an in-process server)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+# --------------- CLIENT ---------------
+
+async def conversation(host, port, messages, latencies, started, open_now, peak):
+    """One user: connect, read the welcome, send messages one by one, then exit."""
+    reader, writer = await asyncio.open_connection(host, port)
+    open_now[0] += 1
+    peak[0] = max(peak[0], open_now[0])
+    try:
+        for _ in WELCOME:
+            await reader.readline()
+        # Wait until every session is connected, so they really overlap
+        await started.wait()
+        for text in messages + ["exit"]:
+            start = time.perf_counter()
+            writer.write(text.encode() + b"\n")
+            reply = await reader.readline()
+            if not reply:
+                raise ConnectionError("server closed the connection")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        open_now[0] -= 1
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    server = chat = None
+    host, port = args.host, args.port
+    if not args.external:
+        chat = ChatServer(max_sessions=args.sessions)
+        server = await chat.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    latencies, open_now, peak = [], [0], [0]
+    started = asyncio.Event()
+    tasks = []
+    connect_start = time.perf_counter()
+    for i in range(args.sessions):
+        messages = rng.choices(MESSAGES, k=args.messages)
+        tasks.append(asyncio.create_task(
+            conversation(host, port, messages, latencies, started, open_now, peak)
+        ))
+        if i % CONNECT_BATCH == CONNECT_BATCH - 1:
+            await asyncio.sleep(0)
+    # Give every client a chance to connect before the conversations start
+    while open_now[0] < args.sessions and not all(t.done() for t in tasks):
+        await asyncio.sleep(0.01)
+    connect_seconds = time.perf_counter() - connect_start
+
+    start = time.perf_counter()
+    started.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    failed = [r for r in results if isinstance(r, Exception)]
+    print("-" * 52)
+    print(f"{'Sessions (concurrent)':30} {args.sessions:>12,} (peak {peak[0]:,})")
+    print(f"{'Messages per session':30} {args.messages + 1:>12,}")
+    print(f"{'Connect time':30} {connect_seconds:>10.2f} s")
+    print(f"{'Conversation time':30} {elapsed:>10.2f} s")
+    print(f"{'Failed sessions':30} {len(failed):>12,}")
+    if failed:
+        print(f"{'  first error':30} {failed[0]!r}")
+    if latencies:
+        print("-" * 52)
+        print(f"{'Replies':30} {len(latencies):>12,}")
+        print(f"{'Throughput':30} {len(latencies) / elapsed:>12,.0f} msg/s")
+        print(f"{'Latency p50':30} {statistics.median(latencies) * 1000:>10.2f} ms")
+        print(f"{'Latency p95':30} {percentile(latencies, 95) * 1000:>10.2f} ms")
+        print(f"{'Latency p99':30} {percentile(latencies, 99) * 1000:>10.2f} ms")
+    print("-" * 52)
+    return 1 if failed else 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the chatbot server.")
+    parser.add_argument("--sessions", type=int, default=2000, help="Concurrent conversations")
+    parser.add_argument("--messages", type=int, default=10, help="Messages per conversation")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--external", action="store_true",
+                        help="Use a server that is already running instead of an in-process one")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    raise_file_limit(args.sessions * 2 + 100)
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# sandbox.py
+"""
+Time-limited evaluation of risky calculations
+
+The fast path in evaluator.py is protected by size checks, but the SymPy
+fallback is not: a symbolic expression can keep a CPU busy for minutes.
+EvaluationPool runs those calculations in separate worker processes:
+
+- the caller (the console loop or the asyncio server) never runs SymPy
+  itself, so it never blocks on it
+- every calculation has a wall-clock budget; when it runs over, the
+  stuck workers are killed and replaced (a thread can't be stopped, a
+  process can) and the caller gets LimitExceeded right away
+- other calculations that were still running are resubmitted to the
+  new workers
+- multiprocessing, concurrent.futures and asyncio are imported on first
+  use, so the console chatbot starts without paying for them
+
+Usage:
+    from sandbox import EvaluationPool
+    pool = EvaluationPool(workers=2, timeout=2.0)
+    pool.calculate("(-8)^(1/3)")              # blocking
+    await pool.calculate_async("(-8)^(1/3)")  # from asyncio code
+"""
+
+import itertools
+import signal
+import threading
+
+from evaluator import LimitExceeded, calculate_slow
+
+# --------------- CONFIG ---------------
+
+WORKERS = 2
+TIMEOUT = 2.0  # seconds per calculation
+
+
+def init_worker():
+    # Ctrl+C is handled by the parent, which then terminates the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class EvaluationPool:
+    """A restartable process pool with a time limit per calculation."""
+
+    def __init__(self, workers=WORKERS, timeout=TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.ids = itertools.count()
+        self.pending = {}  # job id -> (expr, Future)
+        self.generation = 0
+        self.pool = None
+
+    # ---------- Submitting ----------
+
+    def submit(self, expr):
+        """Start a calculation; returns a Future of (success, result)."""
+        from concurrent.futures import Future
+
+        future = Future()
+        # Mark it running, so giving up on it (e.g. asyncio.wait_for) can't cancel it
+        future.set_running_or_notify_cancel()
+        with self.lock:
+            job_id = next(self.ids)
+            self.pending[job_id] = (expr, future)
+            self._start(job_id, expr)
+        return future
+
+    def _start(self, job_id, expr):
+        # Called with self.lock held
+        if self.pool is None:
+            import multiprocessing
+
+            self.pool = multiprocessing.Pool(self.workers, initializer=init_worker)
+        generation = self.generation
+        self.pool.apply_async(
+            calculate_slow, (expr,),
+            callback=lambda result: self._finish(job_id, generation, result),
+            error_callback=lambda error: self._finish(job_id, generation, (False, None)),
+        )
+
+    def _finish(self, job_id, generation, result):
+        # Runs in the pool's result thread
+        with self.lock:
+            if generation != self.generation or job_id not in self.pending:
+                return  # answer from workers that were already replaced
+            _, future = self.pending.pop(job_id)
+        future.set_result(result)
+
+    # ---------- Time limit ----------
+
+    def abandon(self, future):
+        """Give up on a calculation that ran over time: replace the workers."""
+        with self.lock:
+            job_id = next((i for i, (_, f) in self.pending.items() if f is future), None)
+            if job_id is None:
+                return  # it finished after all
+            del self.pending[job_id]
+            self.generation += 1
+            old_pool, self.pool = self.pool, None
+            for other_id, (expr, _) in self.pending.items():
+                self._start(other_id, expr)
+        old_pool.terminate()
+
+    def calculate(self, expr):
+        """Blocking: (success, result), or LimitExceeded after `timeout` seconds."""
+        from concurrent.futures import TimeoutError
+
+        future = self.submit(expr)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            self.abandon(future)
+            raise LimitExceeded(f"it took longer than {self.timeout:g} s")
+
+    async def calculate_async(self, expr):
+        """Like calculate(), but awaits the result instead of blocking the event loop."""
+        import asyncio
+
+        future = self.submit(expr)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.abandon(future)
+            raise LimitExceeded(f"it took longer than {self.timeout:g} s")
+
+    def close(self):
+        with self.lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.terminate()
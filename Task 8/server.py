@@ -0,0 +1,154 @@
+# server.py
+"""
+Multi-session chatbot server (asyncio, line-based TCP)
+
+Many people can talk to the bot at the same time, each with their own
+conversation state, from one process and one thread:
+
+- protocol: UTF-8 text, one message per line in, one reply per line out
+  (the welcome text is sent first, 'exit' ends the conversation)
+- every connection gets its own Session and a small bounded queue; when
+  a client sends faster than the bot answers, the queue fills up and the
+  server simply stops reading from that socket (TCP back-pressure)
+  instead of buffering without limit
+- lines longer than MAX_LINE, idle clients and connections above
+  MAX_SESSIONS are dropped
+
+Usage:
+    python server.py --port 8765
+    nc localhost 8765              # talk to it
+"""
+
+import argparse
+import asyncio
+
+from engine import WELCOME, ChatEngine
+
+# --------------- CONFIG ---------------
+
+HOST = "127.0.0.1"
+PORT = 8765
+QUEUE_SIZE = 8          # unanswered messages per session
+MAX_SESSIONS = 10_000
+MAX_LINE = 4096         # bytes per message
+IDLE_TIMEOUT = 300      # seconds without a message before disconnecting
+BACKLOG = 4096          # pending connections (the OS may cap this, see somaxconn)
+BOT_PREFIX = "🤖 Chatbot: "
+
+
+class ChatServer:
+    """Serves one ChatEngine to many concurrent TCP sessions."""
+
+    def __init__(self, engine=None, queue_size=QUEUE_SIZE, max_sessions=MAX_SESSIONS,
+                 idle_timeout=IDLE_TIMEOUT):
+        self.engine = engine or ChatEngine()
+        self.queue_size = queue_size
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions = {}
+        self.stats = {"sessions": 0, "peak_sessions": 0, "messages": 0, "rejected": 0}
+
+    async def start(self, host=HOST, port=PORT):
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_LINE, backlog=BACKLOG)
+
+    # ---------- One connection ----------
+
+    async def handle(self, reader, writer):
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            writer.write(f"{BOT_PREFIX}Sorry, too many people are chatting right now.\n".encode())
+            await self.close(writer)
+            return
+
+        session = self.engine.new_session()
+        self.sessions[session.id] = session
+        self.stats["sessions"] += 1
+        self.stats["peak_sessions"] = max(self.stats["peak_sessions"], len(self.sessions))
+
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        answering = asyncio.create_task(self.answer(session, queue, writer))
+        try:
+            lines = [BOT_PREFIX + WELCOME[0]] + WELCOME[1:]
+            writer.write(("\n".join(lines) + "\n").encode())
+            await self.read_messages(reader, queue)
+        finally:
+            await queue.put(None)  # tells answer() to finish
+            await answering
+            del self.sessions[session.id]
+            await self.close(writer)
+
+    async def read_messages(self, reader, queue):
+        """Queue every incoming line until EOF, 'exit', a timeout or a too long line."""
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+            except (asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError,
+                    ConnectionError):
+                return
+            if not line:
+                return
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            # Waits here while the queue is full (back-pressure)
+            await queue.put(text)
+            if text.strip().lower() == "exit":
+                return
+
+    async def answer(self, session, queue, writer):
+        """Reply to queued messages in order, one line each."""
+        while True:
+            text = await queue.get()
+            if text is None or session.closed:
+                return
+            # Slow calculations are awaited (in the worker pool), so other
+            # sessions keep being served meanwhile
+            reply = await self.engine.reply_async(session, text)
+            self.stats["messages"] += 1
+            try:
+                writer.write(f"{BOT_PREFIX}{reply}\n".encode())
+                await writer.drain()
+            except ConnectionError:
+                session.closed = True
+
+    @staticmethod
+    async def close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve the chatbot to many users over TCP.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE,
+                        help="Unanswered messages buffered per session")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    return parser.parse_args()
+
+
+async def serve(args):
+    chat = ChatServer(queue_size=args.queue_size, max_sessions=args.max_sessions)
+    server = await chat.start(args.host, args.port)
+    print(f"[INFO] Chatbot server listening on {args.host}:{args.port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        chat.engine.close()
+        print(f"[INFO] Served {chat.stats['sessions']} sessions, "
+              f"{chat.stats['messages']} messages (peak {chat.stats['peak_sessions']} at once)")
+
+
+def main():
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
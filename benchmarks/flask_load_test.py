@@ -0,0 +1,479 @@
+# flask_load_test.py
+"""
+Load test & latency benchmark for the Flask services.
+
+Drives every endpoint of the Task 4 User API (users CRUD) and the Task 6
+portfolio site (/ and /contact) with concurrent workers, then records
+throughput and p50/p95/p99 latency to a JSON file. Flood scenarios check
+that the contact form's rate limiter keeps the site responsive.
+
+Two modes:
+- client: in-process, using Flask's test client (no network, measures app code)
+- server: starts a local threaded server and sends real HTTP requests
+
+Examples:
+    python flask_load_test.py run --output baseline.json
+    python flask_load_test.py run --mode server -c 16 -n 5000 --baseline baseline.json
+    python flask_load_test.py compare baseline.json latest.json
+"""
+
+import argparse
+import contextlib
+import http.client
+import importlib.util
+import io
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlencode
+
+# --------------- CONFIG ---------------
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATHS = {
+    "task4": os.path.join(REPO_ROOT, "Task 4", "app.py"),
+    "task6": os.path.join(REPO_ROOT, "Task 6", "app.py"),
+}
+
+SEED_USERS = 1000
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = 8
+DEFAULT_THRESHOLD = 20.0  # % change that counts as a regression
+
+FLOOD_THREADS = 4
+
+# A request is (method, path, headers, body bytes). `allowed` lists
+# statuses >= 400 that are expected (not errors). setup() may return a
+# "stop" callable in its context, which is called after the run.
+Scenario = namedtuple("Scenario", ["name", "app", "setup", "make_request", "allowed"],
+                      defaults=((),))
+
+
+# --------------- SCENARIOS ---------------
+
+def json_request(method, path, payload):
+    return method, path, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def seed_users(client, prefix, count):
+    """Create users through the bulk endpoint and return their ids."""
+    items = [
+        {"name": f"{prefix} {i}", "email": f"{prefix}{i}@example.com", "age": 18 + i % 60}
+        for i in range(count)
+    ]
+    resp = client.post("/users:batch", json=items)
+    return [r["id"] for r in resp.get_json()["results"]]
+
+
+def setup_users(client, requests):
+    return {"ids": seed_users(client, "seed", SEED_USERS)}
+
+
+def setup_deletes(client, requests):
+    return {"ids": seed_users(client, "delete", requests)}
+
+
+def setup_nothing(client, requests):
+    return {}
+
+
+def setup_page_cache_off(client, requests):
+    # Same page, but rendered through Jinja on every request
+    client.application.config["PAGE_CACHE"] = False
+    return {}
+
+
+def setup_asset(client, requests):
+    app = client.application
+    with app.test_request_context():
+        return {"path": app.url_for("static", filename="style.css")}
+
+
+def setup_contact(client, requests):
+    # Measures storing messages, so every one of them must get through
+    client.application.config["CONTACT_RATE_LIMIT"] = False
+    return {}
+
+
+def contact_request(i, email, message="Load test message"):
+    return (
+        "POST", "/contact",
+        {"Content-Type": "application/x-www-form-urlencoded"},
+        urlencode({"name": f"Bench {i}", "email": email, "message": message}).encode(),
+    )
+
+
+def spam_request(i):
+    return contact_request(i, f"bot{i}@spam.example", "Buy cheap followers now!")
+
+
+def setup_flood(client, requests):
+    """Spam /contact from FLOOD_THREADS background threads until stop() is called."""
+    app = client.application
+    done = threading.Event()
+    sent = itertools.count()
+
+    def flood():
+        bot = app.test_client()
+        while not done.is_set():
+            i = next(sent)
+            method, path, headers, body = spam_request(i)
+            bot.open(path, method=method, headers=headers, data=body)
+
+    threads = [threading.Thread(target=flood, daemon=True) for _ in range(FLOOD_THREADS)]
+    for thread in threads:
+        thread.start()
+
+    def stop():
+        done.set()
+        for thread in threads:
+            thread.join()
+
+    return {"stop": stop}
+
+
+def pick_user(ctx, i):
+    return ctx["ids"][i % len(ctx["ids"])]
+
+
+SCENARIOS = [
+    Scenario(
+        "users.list", "task4", setup_users,
+        lambda ctx, i: ("GET", "/users?limit=50", {}, b""),
+    ),
+    Scenario(
+        "users.get", "task4", setup_users,
+        lambda ctx, i: ("GET", f"/users/{pick_user(ctx, i)}", {}, b""),
+    ),
+    Scenario(
+        "users.create", "task4", setup_nothing,
+        lambda ctx, i: json_request(
+            "POST", "/users", {"name": f"bench {i}", "email": f"bench{i}@example.com", "age": 30}
+        ),
+    ),
+    Scenario(
+        "users.update", "task4", setup_users,
+        lambda ctx, i: json_request("PUT", f"/users/{pick_user(ctx, i)}", {"age": i % 90}),
+    ),
+    Scenario(
+        "users.delete", "task4", setup_deletes,
+        lambda ctx, i: ("DELETE", f"/users/{ctx['ids'][i]}", {}, b""),
+    ),
+    Scenario(
+        "site.home", "task6", setup_nothing,
+        lambda ctx, i: ("GET", "/", {}, b""),
+    ),
+    Scenario(
+        "site.nocache", "task6", setup_page_cache_off,
+        lambda ctx, i: ("GET", "/", {}, b""),
+    ),
+    Scenario(
+        "site.asset", "task6", setup_asset,
+        lambda ctx, i: ("GET", ctx["path"], {"Accept-Encoding": "gzip, br"}, b""),
+    ),
+    Scenario(
+        "site.contact", "task6", setup_contact,
+        lambda ctx, i: contact_request(i, f"bench{i}@example.com"),
+    ),
+    Scenario(
+        "site.flood", "task6", setup_nothing,
+        lambda ctx, i: spam_request(i),
+        allowed=(429,),
+    ),
+    Scenario(
+        "site.home+flood", "task6", setup_flood,
+        lambda ctx, i: ("GET", "/", {}, b""),
+    ),
+]
+
+
+# --------------- APP LOADING ---------------
+
+def load_app(key):
+    """Import a fresh copy of a task's app.py and return the module."""
+    path = APP_PATHS[key]
+    # Apps import helper modules that sit next to them
+    app_dir = os.path.dirname(path)
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    spec = importlib.util.spec_from_file_location(f"{key}_app", path)
+    module = importlib.util.module_from_spec(spec)
+    # Flask looks the module up here to find its templates/static folders
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def unload_app(module):
+    """Stop what a task's app started in the background (Task 6's contact writer)."""
+    close = getattr(module, "close_contact_writer", None)
+    if close is not None:
+        close()
+
+
+# --------------- DRIVERS ---------------
+
+class ClientDriver:
+    """Sends requests through Flask's test client (one client per thread)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.local = threading.local()
+
+    def send(self, method, path, headers, body):
+        client = getattr(self.local, "client", None)
+        if client is None:
+            client = self.local.client = self.app.test_client()
+        resp = client.open(path, method=method, headers=headers, data=body)
+        return resp.status_code
+
+    def close(self):
+        pass
+
+
+class ServerDriver:
+    """Runs the app on a local threaded server and sends real HTTP requests."""
+
+    def __init__(self, app):
+        from werkzeug.serving import make_server
+
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        self.server = make_server("127.0.0.1", 0, app, threaded=True)
+        self.port = self.server.server_port
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def send(self, method, path, headers, body):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=30)
+        try:
+            conn.request(method, path, body=body or None, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            return resp.status
+        finally:
+            conn.close()
+
+    def close(self):
+        self.server.shutdown()
+
+
+DRIVERS = {"client": ClientDriver, "server": ServerDriver}
+
+
+# --------------- RUNNER ---------------
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_scenario(scenario, app, driver, total, concurrency):
+    ctx = scenario.setup(app.test_client(), total)
+    counter = itertools.count()
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker():
+        nonlocal errors
+        local_latencies = []
+        local_errors = 0
+        while True:
+            i = next(counter)
+            if i >= total:
+                break
+            method, path, headers, body = scenario.make_request(ctx, i)
+            start = time.perf_counter()
+            try:
+                status = driver.send(method, path, headers, body)
+            except Exception:
+                status = 599
+            local_latencies.append(time.perf_counter() - start)
+            if status >= 400 and status not in scenario.allowed:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+    finally:
+        if "stop" in ctx:
+            ctx["stop"]()
+
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ms), 3) if ms else 0.0,
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+    }
+
+
+def run_benchmark(mode, total, concurrency, only=None):
+    scenarios = [s for s in SCENARIOS if not only or s.name in only]
+    results = {}
+    workdir = tempfile.TemporaryDirectory()
+    old_cwd = os.getcwd()
+    # Task 6 writes contact messages relative to the working directory
+    os.chdir(workdir.name)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for scenario in scenarios:
+                module = load_app(scenario.app)
+                driver = DRIVERS[mode](module.app)
+                try:
+                    results[scenario.name] = run_scenario(
+                        scenario, module.app, driver, total, concurrency
+                    )
+                finally:
+                    driver.close()
+                    # Closes the SQLite files before the next scenario (and
+                    # before workdir is removed, which Windows refuses while
+                    # they are open)
+                    unload_app(module)
+                # stdout is silenced while the apps run, so report on stderr
+                print(format_result(scenario.name, results[scenario.name]), file=sys.stderr)
+    finally:
+        os.chdir(old_cwd)
+        workdir.cleanup()
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "mode": mode,
+            "requests_per_scenario": total,
+            "concurrency": concurrency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def format_result(name, r):
+    return (
+        f"{name:16} {r['throughput_rps']:>10.1f} req/s  "
+        f"p50 {r['p50_ms']:>8.3f} ms  p95 {r['p95_ms']:>8.3f} ms  "
+        f"p99 {r['p99_ms']:>8.3f} ms  errors {r['errors']}"
+    )
+
+
+# --------------- COMPARE ---------------
+
+def compare_results(baseline, current, threshold):
+    """Print a comparison table and return the names of regressed scenarios."""
+    regressions = []
+    for key in ("mode", "concurrency"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"[WARN] {key} differs: baseline={baseline['meta'].get(key)}, "
+                  f"current={current['meta'].get(key)}")
+    print(f"{'scenario':16} {'rps old':>10} {'rps new':>10} {'p95 old':>9} {'p95 new':>9}  status")
+    print("-" * 72)
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:16} {'-':>10} {new['throughput_rps']:>10.1f} {'-':>9} {new['p95_ms']:>9.3f}  new")
+            continue
+
+        rps_drop = pct_change(old["throughput_rps"], new["throughput_rps"]) * -1
+        p95_rise = pct_change(old["p95_ms"], new["p95_ms"])
+        regressed = rps_drop > threshold or p95_rise > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:16} {old['throughput_rps']:>10.1f} {new['throughput_rps']:>10.1f} "
+            f"{old['p95_ms']:>9.3f} {new['p95_ms']:>9.3f}  "
+            f"{'REGRESSION' if regressed else 'ok'}"
+        )
+    print("-" * 72)
+    if regressions:
+        print(f"[FAIL] {len(regressions)} scenario(s) regressed by more than {threshold}%: "
+              + ", ".join(regressions))
+    else:
+        print(f"[OK] No regressions above {threshold}%")
+    return regressions
+
+
+def pct_change(old, new):
+    if not old:
+        return 0.0
+    return (new - old) / old * 100
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the Task 4 and Task 6 Flask apps.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the benchmark and write a JSON result file")
+    run.add_argument("--mode", choices=sorted(DRIVERS), default="client")
+    run.add_argument("-n", "--requests", type=int, default=DEFAULT_REQUESTS,
+                     help="Requests per scenario")
+    run.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                     help="Concurrent worker threads")
+    run.add_argument("-s", "--scenario", action="append",
+                     help="Only run this scenario (repeatable)")
+    run.add_argument("-o", "--output", default="benchmark_results.json")
+    run.add_argument("--baseline", help="Compare against this baseline JSON after the run")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    cmp_ = sub.add_parser("compare", help="Compare two result files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "compare":
+        regressions = compare_results(load_json(args.baseline), load_json(args.current), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    unknown = set(args.scenario or []) - {s.name for s in SCENARIOS}
+    if unknown:
+        print(f"[ERROR] Unknown scenario(s): {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    report = run_benchmark(args.mode, args.requests, args.concurrency, args.scenario)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[DONE] Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_results(load_json(args.baseline), report, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# startup_time.py
+"""
+Start-up time benchmark for the CLI tools.
+
+For every tool this measures:
+
+- time to first prompt: from launching `python tool.py` until its first
+  prompt (e.g. "Enter your choice") appears on stdout - what a user
+  actually waits for
+- import time: how long `import tool` takes, from `python -X importtime`,
+  plus the heaviest modules it pulls in (to see what to make lazy)
+
+Each tool has a budget for time to first prompt; a run fails when a tool
+is over budget, or (with --baseline) slower than the baseline by more
+than the threshold.
+
+Examples:
+    python startup_time.py run --output startup_baseline.json
+    python startup_time.py run --baseline startup_baseline.json
+    python startup_time.py compare startup_baseline.json startup_latest.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+
+# --------------- CONFIG ---------------
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 25.0  # % slower than the baseline that counts as a regression
+NOISE_MS = 5.0            # differences below this are never a regression
+PROMPT_TIMEOUT = 30       # seconds to wait for a prompt
+TOP_IMPORTS = 3
+
+# prompt: text that shows the tool is ready; answer: what is typed to quit
+Tool = namedtuple("Tool", ["name", "folder", "module", "args", "prompt", "answer", "budget_ms"])
+
+TOOLS = [
+    Tool("calculator", "Task 1", "calculator", [], "Enter first number:", "x\n", 100),
+    Tool("todo", "Task 2", "todo", [], "Choose (1-13):", "13\n", 150),
+    Tool("news_scraper", "Task 3", "news_scraper", [], "Enter your choice (1-3):", "3\n", 150),
+    Tool("image_tool", "Task 7", "image_tool", ["--help"], "usage:", "", 150),
+    Tool("chatbot", "Task 8", "chatbot", [], "You:", "exit\n", 200),
+]
+
+
+# --------------- MEASURING ---------------
+
+def script_path(tool):
+    return os.path.join(REPO_ROOT, tool.folder, f"{tool.module}.py")
+
+
+def time_to_prompt(tool, workdir):
+    """Seconds from process start until tool.prompt is printed."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, script_path(tool), *tool.args],
+        cwd=workdir, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    prompt = tool.prompt.encode()
+    seen = b""
+    try:
+        while prompt not in seen:
+            chunk = os.read(proc.stdout.fileno(), 65536)
+            if not chunk:
+                raise RuntimeError(f"{tool.name} exited before showing {tool.prompt!r}")
+            seen += chunk
+            if time.perf_counter() - start > PROMPT_TIMEOUT:
+                raise RuntimeError(f"{tool.name} didn't show {tool.prompt!r} within {PROMPT_TIMEOUT} s")
+        return time.perf_counter() - start
+    finally:
+        try:
+            proc.communicate(tool.answer.encode(), timeout=PROMPT_TIMEOUT)
+        except (subprocess.TimeoutExpired, OSError):
+            proc.kill()
+            proc.wait()
+
+
+def parse_importtime(stderr):
+    """-X importtime lines -> [(depth, cumulative µs, module name)]."""
+    # "import time:       412 |       1337 |     json.decoder"
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        # one leading space, then two more per nesting level
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((depth, int(cumulative_us), name.strip()))
+    return entries
+
+
+def import_time(tool):
+    """(ms to import the tool's module, [(module, ms)] of its heaviest imports)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {tool.module}"],
+        cwd=os.path.join(REPO_ROOT, tool.folder), capture_output=True, text=True,
+        timeout=PROMPT_TIMEOUT,
+    )
+    children = []
+    for depth, cumulative_us, name in parse_importtime(proc.stderr):
+        if depth == 0:
+            if name == tool.module:
+                children.sort(key=lambda child: -child[1])
+                return cumulative_us / 1000, [(n, us / 1000) for n, us in children[:TOP_IMPORTS]]
+            children = []
+        elif depth == 1:
+            children.append((name, cumulative_us))
+    raise RuntimeError(f"Could not import {tool.module}: {proc.stderr.strip().splitlines()[-1:]}")
+
+
+def measure(tool, repeat, workdir):
+    prompts = [time_to_prompt(tool, workdir) * 1000 for _ in range(repeat)]
+    imports = [import_time(tool) for _ in range(repeat)]
+    return {
+        "first_prompt_ms": round(statistics.median(prompts), 2),
+        "first_prompt_min_ms": round(min(prompts), 2),
+        "import_ms": round(statistics.median(ms for ms, _ in imports), 2),
+        "heaviest_imports": [[name, round(ms, 2)] for name, ms in imports[-1][1]],
+        "budget_ms": tool.budget_ms,
+    }
+
+
+def interpreter_ms(repeat):
+    """Bare `python -c pass`, for reference: no tool can start faster."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(times), 2)
+
+
+def run_benchmark(repeat, only=None):
+    tools = [t for t in TOOLS if not only or t.name in only]
+    results = {}
+    bare = interpreter_ms(repeat)
+    print(f"{'interpreter':14} {bare:>8.1f} ms  (python -c pass)", file=sys.stderr)
+    with tempfile.TemporaryDirectory() as workdir:
+        # Tools read/write files relative to the working directory
+        for tool in tools:
+            results[tool.name] = measure(tool, repeat, workdir)
+            print(format_result(tool.name, results[tool.name]), file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+            "interpreter_ms": bare,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def format_result(name, r):
+    heaviest = ", ".join(f"{n} {ms:.0f}" for n, ms in r["heaviest_imports"])
+    return (f"{name:14} {r['first_prompt_ms']:>8.1f} ms to prompt "
+            f"(budget {r['budget_ms']})  import {r['import_ms']:>6.1f} ms  [{heaviest}]")
+
+
+# --------------- CHECKS ---------------
+
+def over_budget(report):
+    """Names of tools whose time to first prompt is above their budget."""
+    failed = [name for name, r in report["results"].items() if r["first_prompt_ms"] > r["budget_ms"]]
+    for name in failed:
+        r = report["results"][name]
+        print(f"[FAIL] {name}: {r['first_prompt_ms']:.1f} ms to first prompt, budget {r['budget_ms']} ms")
+    return failed
+
+
+def compare_results(baseline, current, threshold):
+    """Print a comparison table and return the names of regressed tools."""
+    regressions = []
+    print(f"{'tool':14} {'prompt old':>11} {'prompt new':>11} {'import old':>11} {'import new':>11}  status")
+    print("-" * 72)
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:14} {'-':>11} {new['first_prompt_ms']:>11.1f} {'-':>11} "
+                  f"{new['import_ms']:>11.1f}  new")
+            continue
+        slower = new["first_prompt_ms"] - old["first_prompt_ms"]
+        regressed = slower > NOISE_MS and slower / old["first_prompt_ms"] * 100 > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:14} {old['first_prompt_ms']:>11.1f} {new['first_prompt_ms']:>11.1f} "
+              f"{old['import_ms']:>11.1f} {new['import_ms']:>11.1f}  "
+              f"{'REGRESSION' if regressed else 'ok'}")
+    print("-" * 72)
+    if regressions:
+        print(f"[FAIL] {len(regressions)} tool(s) start more than {threshold}% slower: "
+              + ", ".join(regressions))
+    else:
+        print(f"[OK] No start-up regressions above {threshold}%")
+    return regressions
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --------------- CLI ---------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measure start-up time of the CLI tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Measure and write a JSON result file")
+    run.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT,
+                     help="Launches per tool (the median is kept)")
+    run.add_argument("-t", "--tool", action="append", help="Only measure this tool (repeatable)")
+    run.add_argument("-o", "--output", default="startup_results.json")
+    run.add_argument("--baseline", help="Compare against this baseline JSON after the run")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    cmp_ = sub.add_parser("compare", help="Compare two result files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "compare":
+        regressions = compare_results(load_json(args.baseline), load_json(args.current), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    unknown = set(args.tool or []) - {t.name for t in TOOLS}
+    if unknown:
+        print(f"[ERROR] Unknown tool(s): {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    report = run_benchmark(args.repeat, args.tool)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[DONE] Results written to {args.output}")
+
+    failed = over_budget(report)
+    if args.baseline:
+        failed += compare_results(load_json(args.baseline), report, args.threshold)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
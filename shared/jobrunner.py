@@ -0,0 +1,247 @@
+# jobrunner.py
+"""
+Shared process-pool job runner for the batch tools
+
+Some tools do CPU-heavy work per item (resizing images in Task 7,
+rendering PDFs in Task 2 and Task 3). A tool describes that work as a
+list of Jobs and JobRunner spreads them over all CPU cores:
+
+- chunking: jobs are sent to the workers in chunks, so tiny jobs don't
+  pay one round-trip each
+- warm-up: every worker imports the heavy modules it will need (PIL,
+  fpdf, ...) once, when it starts, instead of inside the first job
+- failure isolation: an exception in one job is recorded as that job's
+  error; the other jobs keep running. If a worker process dies (a crash
+  in C code, os._exit, the OOM killer), the workers are replaced and the
+  chunks that were running are retried one at a time, so only the job
+  that kills its worker fails
+- timeouts: a job that runs longer than `timeout` seconds is stopped
+  (SIGALRM inside the worker). If a worker is stuck where that can't
+  reach it (inside C code), the workers are replaced and the jobs of
+  the stuck chunk are retried one by one, so only the guilty job fails
+- reporting: every job's result and duration, plus totals and jobs/s
+
+Job functions must be defined at module level (they are pickled to the
+worker processes by name).
+
+Usage:
+    from jobrunner import Job, JobRunner
+    jobs = [Job(name, resize_image, (path, size)) for name, path in ...]
+    report = JobRunner(timeout=60, preload=["PIL.Image"]).run(jobs)
+    print(report.summary())
+"""
+
+import importlib
+import math
+import os
+import signal
+import time
+from collections import deque, namedtuple
+
+# --------------- CONFIG ---------------
+
+CHUNKS_PER_WORKER = 4   # smaller chunks balance better, larger ones cost less IPC
+HARD_TIMEOUT_GRACE = 5  # extra seconds before a stuck worker is killed
+POLL_SECONDS = 0.05
+
+Job = namedtuple("Job", ["name", "func", "args"])
+JobResult = namedtuple("JobResult", ["name", "ok", "value", "error", "seconds"])
+
+
+class JobTimeout(Exception):
+    """Raised inside a job that ran past its time limit."""
+
+
+# --------------- WORKER SIDE ---------------
+
+def init_worker(preload):
+    # Ctrl+C is handled by the parent, which then terminates the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for module in preload:
+        importlib.import_module(module)
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+
+def run_chunk(chunk, timeout=None):
+    """Run (index, Job) pairs one after another; never raises."""
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    results = []
+    for index, job in chunk:
+        start = time.perf_counter()
+        try:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                value = job.func(*job.args)
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            result = JobResult(job.name, True, value, None, 0.0)
+        except JobTimeout:
+            result = JobResult(job.name, False, None, f"timed out after {timeout:g} s", 0.0)
+        except Exception as e:
+            result = JobResult(job.name, False, None, f"{type(e).__name__}: {e}", 0.0)
+        results.append((index, result._replace(seconds=time.perf_counter() - start)))
+    return results
+
+
+# --------------- PARENT SIDE ---------------
+
+class RunReport:
+    """Results of one run, in job order, plus aggregate numbers."""
+
+    def __init__(self, results, seconds, workers):
+        self.results = results
+        self.seconds = seconds
+        self.workers = workers
+
+    @property
+    def succeeded(self):
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failures(self):
+        return [r for r in self.results if not r.ok]
+
+    def summary(self):
+        count = len(self.results)
+        rate = count / self.seconds if self.seconds else 0.0
+        busy = sum(r.seconds for r in self.results)
+        return (f"{count} jobs ({self.succeeded} ok, {len(self.failures)} failed) "
+                f"in {self.seconds:.2f} s on {self.workers} worker(s) - {rate:.1f} jobs/s, "
+                f"{busy / count if count else 0:.3f} s per job")
+
+
+class JobRunner:
+    """Runs Jobs on a pool of worker processes (or in-process with workers=1)."""
+
+    def __init__(self, workers=None, chunk_size=None, timeout=None, preload=()):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.preload = tuple(preload)
+
+    def make_chunks(self, jobs):
+        size = self.chunk_size or max(1, math.ceil(len(jobs) / (self.workers * CHUNKS_PER_WORKER)))
+        indexed = list(enumerate(jobs))
+        return [indexed[i:i + size] for i in range(0, len(indexed), size)]
+
+    def run(self, jobs, progress=None):
+        """
+        Run every job and return a RunReport. `progress(result)` is called
+        in this process as each job finishes (e.g. to advance a progress bar).
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        start = time.perf_counter()
+
+        def collect(chunk_results):
+            for index, result in chunk_results:
+                results[index] = result
+                if progress:
+                    progress(result)
+
+        if self.workers == 1 or len(jobs) <= 1:
+            # Not worth starting processes; same isolation and (soft) timeouts
+            for module in self.preload:
+                importlib.import_module(module)
+            for chunk in self.make_chunks(jobs):
+                collect(run_chunk(chunk, self.timeout))
+        else:
+            self._run_pool(self.make_chunks(jobs), collect)
+
+        return RunReport(results, time.perf_counter() - start, self.workers)
+
+    def _run_pool(self, chunks, collect):
+        # Imported here: tools that load this module shouldn't pay for it at start-up
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from concurrent.futures.process import BrokenProcessPool
+
+        def fail(chunk, error, seconds):
+            collect([(index, JobResult(job.name, False, None, error, seconds))
+                     for index, job in chunk])
+
+        pending = deque(chunks)
+        suspects = deque()  # chunks that were running when a worker died
+        running = {}        # Future -> (chunk, deadline)
+        pool = self._new_pool()
+        try:
+            while pending or suspects or running:
+                # Only as many chunks in flight as workers, so a chunk's
+                # deadline starts when it actually starts running. Suspects
+                # run alone, so if a worker dies again the culprit is known.
+                while (suspects and not running) or (pending and not suspects
+                                                     and len(running) < self.workers):
+                    chunk = (suspects or pending).popleft()
+                    deadline = None
+                    if self.timeout:
+                        deadline = time.monotonic() + self.timeout * len(chunk) + HARD_TIMEOUT_GRACE
+                    running[pool.submit(run_chunk, chunk, self.timeout)] = (chunk, deadline)
+
+                done, _ = wait(running, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                broken = []
+                for future in done:
+                    chunk, _ = running.pop(future)
+                    try:
+                        collect(future.result())
+                    except BrokenProcessPool:
+                        broken.append(chunk)
+                if broken:
+                    # A worker died; every chunk still in flight fails with it
+                    for future, (chunk, _) in list(running.items()):
+                        running.pop(future)
+                        try:
+                            collect(future.result())
+                        except BrokenProcessPool:
+                            broken.append(chunk)
+                    self._stop_pool(pool)
+                    pool = self._new_pool()
+                    if len(broken) > 1:
+                        suspects.extend(broken)
+                    elif len(broken[0]) > 1:
+                        suspects.extend([item] for item in broken[0])  # find the job
+                    else:
+                        fail(broken[0], "worker process died", 0.0)
+                    continue
+
+                now = time.monotonic()
+                stuck = [f for f, (_, deadline) in running.items() if deadline and now > deadline]
+                if stuck:
+                    self._stop_pool(pool)
+                    pool = self._new_pool()
+                    for future in list(running):
+                        chunk, _ = running.pop(future)
+                        if future not in stuck:
+                            pending.appendleft(chunk)        # innocent: run again as is
+                        elif len(chunk) > 1:
+                            pending.extend([item] for item in chunk)  # find the stuck job
+                        else:
+                            fail(chunk, "timed out (worker was killed)", self.timeout)
+        finally:
+            self._stop_pool(pool)
+
+    def _new_pool(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(self.workers, initializer=init_worker,
+                                   initargs=(self.preload,))
+
+    @staticmethod
+    def _stop_pool(pool):
+        """Stop the workers now, even in the middle of a job."""
+        terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+        if terminate is not None:
+            terminate()
+            return
+        # Older versions: kill them directly (shutdown() forgets the list)
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
+        for process in processes:
+            process.join()